@@ -3,6 +3,8 @@
 These constants are shared across backend validation, sanitization, and frontend.
 """
 
+from types import MappingProxyType
+
 # Input field length limits
 MAX_TARGET_AUDIENCE_LENGTH = 500
 MAX_TARGET_OBJECTIVE_LENGTH = 500
@@ -18,7 +20,7 @@ LLM_VIDEO_TIMEOUT_SECONDS = 300  # Longer timeout for video analysis (5 minutes)
 
 # Supported language codes for manual generation
 # ISO 639-1 codes mapped to full names
-SUPPORTED_LANGUAGES = {
+_SUPPORTED_LANGUAGES = {
     "en": "English",
     "es": "Spanish",
     "fr": "French",
@@ -60,6 +62,22 @@ SUPPORTED_LANGUAGES = {
     "gl": "Galician",
 }
 
+# Read-only view so the lookup tables built from it below can never go stale
+SUPPORTED_LANGUAGES = MappingProxyType(_SUPPORTED_LANGUAGES)
+
+# Reverse lookup from casefolded code or name to ISO code, built once at import
+_LANGUAGE_LOOKUP = {
+    **{code.casefold(): code for code in SUPPORTED_LANGUAGES},
+    **{name.casefold(): code for code, name in SUPPORTED_LANGUAGES.items()},
+}
+
+# Membership-only view of the lookup keys for is_valid_language
+_VALID_LANGUAGE_TOKENS = frozenset(_LANGUAGE_LOOKUP)
+
+# Pieces of the normalize_language_to_code error message, built once at import
+_UNSUPPORTED_LANGUAGE_PREFIX = "Unsupported language: "
+_UNSUPPORTED_LANGUAGE_SUFFIX = ". Supported codes: " + ", ".join(sorted(SUPPORTED_LANGUAGES))
+
 # Default language for manual generation
 DEFAULT_OUTPUT_LANGUAGE = "English"
 
@@ -73,14 +91,8 @@ def get_language_code(language_name: str) -> str:
     Returns:
         Two-letter language code (e.g., "en", "es")
     """
-    name_lower = language_name.lower()
-    for code, name in SUPPORTED_LANGUAGES.items():
-        if name.lower() == name_lower:
-            return code
-    # Fallback: assume it's already a code
-    if language_name.lower() in SUPPORTED_LANGUAGES:
-        return language_name.lower()
-    return "en"
+    # Names and codes share one lookup; unknown languages fall back to English
+    return _LANGUAGE_LOOKUP.get(language_name.casefold(), "en")
 
 
 def is_valid_language(language: str) -> bool:
@@ -92,15 +104,7 @@ def is_valid_language(language: str) -> bool:
     Returns:
         True if supported, False otherwise
     """
-    language_lower = language.lower()
-    # Check if it's a code
-    if language_lower in SUPPORTED_LANGUAGES:
-        return True
-    # Check if it's a name
-    for name in SUPPORTED_LANGUAGES.values():
-        if name.lower() == language_lower:
-            return True
-    return False
+    return isinstance(language, str) and language.casefold() in _VALID_LANGUAGE_TOKENS
 
 
 def normalize_language_to_code(language: str) -> str:
@@ -118,17 +122,8 @@ def normalize_language_to_code(language: str) -> str:
     Raises:
         ValueError: If language is not supported
     """
-    language_lower = language.lower()
-
-    # Check if it's already a code
-    if language_lower in SUPPORTED_LANGUAGES:
-        return language_lower
-
-    # Check if it's a name
-    for code, name in SUPPORTED_LANGUAGES.items():
-        if name.lower() == language_lower:
-            return code
+    code = _LANGUAGE_LOOKUP.get(language.casefold())
+    if code is not None:
+        return code
 
-    # Not found
-    supported_codes = ", ".join(sorted(SUPPORTED_LANGUAGES.keys()))
-    raise ValueError(f"Unsupported language: {language}. Supported codes: {supported_codes}")
+    raise ValueError(_UNSUPPORTED_LANGUAGE_PREFIX + language + _UNSUPPORTED_LANGUAGE_SUFFIX)
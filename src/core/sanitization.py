@@ -4,37 +4,170 @@ These functions sanitize user-provided text before it's interpolated into LLM pr
 """
 
 import re
+import unicodedata
+from functools import lru_cache, partial
 from typing import Optional
 
 from .constants import MAX_TARGET_AUDIENCE_LENGTH, MAX_TARGET_OBJECTIVE_LENGTH
 
-# Patterns that could indicate prompt injection attempts
+try:
+    import hyperscan
+except ImportError:  # Optional: falls back to scanning with the re module
+    hyperscan = None
+
+try:
+    import re2 as _regex_engine  # google-re2: linear-time, no backtracking
+except ImportError:
+    _regex_engine = re
+
+# Patterns that could indicate prompt injection attempts (lowercase only:
+# they are matched case-sensitively against case-folded input)
 INJECTION_PATTERNS = [
     # Instructions to ignore/override previous instructions
-    r"ignore\s+(all\s+)?previous\s+instructions?",
-    r"disregard\s+(all\s+)?previous",
-    r"forget\s+(everything|all|what)",
-    r"override\s+instructions?",
-    r"new\s+instructions?:",
+    r"(?:ignore\s+(?:all\s+)?previous\s+instruction|override\s+instruction|new\s+instructions?:)"
+    r"|disregard\s+(?:all\s+)?previous|forget\s+(?:everything|all|what)",
     # System/assistant role manipulation
-    r"system\s*:",
-    r"assistant\s*:",
-    r"user\s*:",
-    r"\[system\]",
-    r"\[assistant\]",
-    r"</?system>",
-    r"</?assistant>",
+    r"(?:system|assistant|user)\s*:|\[(?:system|assistant)\]|</?(?:system|assistant)>",
     # Output manipulation
-    r"output\s*:",
-    r"respond\s+with\s*:",
-    r"reply\s+with\s*:",
-    r"answer\s*:",
-    # Common injection prefixes
-    r"^---+\s*$",  # Markdown horizontal rules at start
-    r"^\*{3,}\s*$",  # Asterisk separators
-    r"^#{1,6}\s+",  # Markdown headers at line start
+    r"(?:output|answer|(?:respond|reply)\s+with)\s*:",
+    # Common injection prefixes: horizontal rules and separators, headers at line start
+    r"^(?:-{3,}|\*{3,})\s*$|^#{1,6}\s+",
 ]
 
+# INJECTION_PATTERNS fused into one ASCII bytes alternation so the fallback
+# scans the UTF-8 input once. Input is case-folded before scanning (see
+# _fold_case), so the patterns match case-sensitively; the multiline flag is inline because
+# re2.compile() does not take re flag arguments
+_COMBINED_PATTERN = _regex_engine.compile(
+    b"(?m)" + b"|".join(b"(?:" + pattern.encode("ascii") + b")" for pattern in INJECTION_PATTERNS)
+)
+
+# Literal substrings that every INJECTION_PATTERNS match must contain;
+# text containing none of them cannot match and skips the pattern scan
+_PATTERN_KEYWORDS = (
+    "ignore", "disregard", "forget", "override", "instruction",
+    "system", "assistant", "user", "output", "respond", "reply", "answer",
+    "---", "***", "#",
+)
+
+# Shortest whitespace-normalized text any pattern can match ("---", "***",
+# "# x"); shorter text skips the scan entirely
+_MIN_INJECTION_LENGTH = 3
+
+# Tail of every rejection message ("Invalid <field>: contains disallowed patterns")
+DISALLOWED_PATTERNS_MESSAGE = "contains disallowed patterns"
+
+
+def _build_hyperscan_database():
+    """Compile INJECTION_PATTERNS into one Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    # Input is case-folded to ASCII before scanning (HS_FLAG_CASELESS only
+    # covers ASCII anyway), so the patterns match case-sensitively
+    flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode("ascii") for pattern in INJECTION_PATTERNS],
+        ids=list(range(len(INJECTION_PATTERNS))),
+        elements=len(INJECTION_PATTERNS),
+        flags=[flags] * len(INJECTION_PATTERNS),
+    )
+    return database
+
+
+_HYPERSCAN_DB = _build_hyperscan_database()
+
+
+def _stop_scan(pattern_id, start, end, flags, context) -> bool:
+    """Hyperscan match handler: returning True stops at the first match."""
+    return True
+
+
+def _hyperscan_matches(data: bytes) -> bool:
+    """Scan UTF-8 bytes with the Hyperscan database."""
+    try:
+        _HYPERSCAN_DB.scan(data, match_event_handler=_stop_scan)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+def _regex_matches(data: bytes) -> bool:
+    """Search UTF-8 bytes with the combined pattern."""
+    return _COMBINED_PATTERN.search(data) is not None
+
+
+# Scan backend, chosen once at import rather than on every call
+_matches_injection = _hyperscan_matches if _HYPERSCAN_DB is not None else _regex_matches
+
+
+# Dotted and dotless i have no ASCII case fold; they match "i" under
+# re.IGNORECASE, so map them before folding
+_ASCII_CONFUSABLES = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def _fold_case(text: str) -> str:
+    """Fold text so non-ASCII case variants of the patterns become ASCII.
+
+    ASCII text only needs lower(). Other text is NFKC-normalized (fullwidth
+    and compatibility forms, the Kelvin sign), has dotted and dotless i
+    mapped, then casefolded (long s becomes "s").
+    """
+    if text.isascii():
+        return text.lower()
+    return unicodedata.normalize("NFKC", text).translate(_ASCII_CONFUSABLES).casefold()
+
+
+def _contains_injection(text: str) -> bool:
+    """Check text against INJECTION_PATTERNS.
+
+    Text is case-folded first, so Unicode case variants of a keyword are
+    caught by the ASCII patterns. Text without any pattern keyword passes
+    without a scan. Candidates are encoded to UTF-8 once (the patterns are
+    ASCII, so multi-byte sequences never match) and get a single Hyperscan
+    pass when the library is installed, otherwise a search of the combined
+    pattern (with RE2 when available, else the re module).
+    """
+    text_folded = _fold_case(text)
+    if not any(keyword in text_folded for keyword in _PATTERN_KEYWORDS):
+        return False
+    return _matches_injection(text_folded.encode("utf-8", "surrogatepass"))
+
+
+def _truncate_at_boundary(text: str, max_length: int) -> str:
+    """Truncate whitespace-normalized text to max_length at a word boundary.
+
+    Falls back to a hard cut when the last space would drop more than a
+    fifth of the allowed length (e.g. a single very long word).
+    """
+    # A space right at max_length means the first max_length chars are whole words
+    cut = text.rfind(' ', 0, max_length + 1)
+    end = cut if cut > max_length * 0.8 else max_length
+    return text[:end].rstrip()
+
+
+@lru_cache(maxsize=2048)
+def _sanitize_impl(text: str, max_length: int) -> Optional[str]:
+    """Truncate, normalize and scan non-blank text, caching by input.
+
+    Callers only go through the cache for text within max_length.
+
+    Returns:
+        Sanitized text, or None if it contains a disallowed pattern
+    """
+    # Normalize whitespace (strip, collapse multiple spaces/newlines)
+    text = " ".join(text.split())
+
+    # Enforce length limit before scanning so the scan never sees cut text
+    if len(text) > max_length:
+        text = _truncate_at_boundary(text, max_length)
+
+    # Check for injection patterns
+    if len(text) >= _MIN_INJECTION_LENGTH and _contains_injection(text):
+        return None
+
+    return text
+
 
 def sanitize_prompt_input(
     text: Optional[str],
@@ -54,61 +187,47 @@ def sanitize_prompt_input(
     Raises:
         ValueError: If input contains obvious injection attempts
     """
-    if text is None:
+    # None, empty and whitespace-only input short-circuit before any work
+    if not text or text.isspace():
         return None
 
-    # Strip whitespace and check if empty
-    text = text.strip()
-    if not text:
-        return None
-
-    # Enforce length limit
-    if len(text) > max_length:
-        text = text[:max_length].rsplit(' ', 1)[0]  # Truncate at word boundary
-        if not text:  # Edge case: single very long word
-            text = text[:max_length]
-
-    # Normalize whitespace (collapse multiple spaces/newlines)
-    text = re.sub(r'\s+', ' ', text)
-
-    # Check for injection patterns
-    text_lower = text.lower()
-    for pattern in INJECTION_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
-            raise ValueError(
-                f"Invalid {field_name}: contains disallowed patterns"
-            )
+    # Only input within the field limit is cached, so oversized client text
+    # cannot pin large strings in memory as cache keys
+    if len(text) <= max_length:
+        result = _sanitize_impl(text, max_length)
+    else:
+        result = _sanitize_impl.__wrapped__(text, max_length)
+    if result is None:
+        raise ValueError(f"Invalid {field_name}: {DISALLOWED_PATTERNS_MESSAGE}")
 
-    return text
+    return result
 
 
-def sanitize_target_audience(text: Optional[str]) -> Optional[str]:
-    """Sanitize target audience input.
+# Field-specific sanitizers with the limit and error label bound at import
+sanitize_target_audience = partial(
+    sanitize_prompt_input,
+    max_length=MAX_TARGET_AUDIENCE_LENGTH,
+    field_name="target audience",
+)
+sanitize_target_audience.__doc__ = """Sanitize target audience input.
 
-    Args:
-        text: User-provided target audience description
-
-    Returns:
-        Sanitized text or None
-    """
-    return sanitize_prompt_input(
-        text,
-        max_length=MAX_TARGET_AUDIENCE_LENGTH,
-        field_name="target audience"
-    )
+Args:
+    text: User-provided target audience description
 
+Returns:
+    Sanitized text or None
+"""
 
-def sanitize_target_objective(text: Optional[str]) -> Optional[str]:
-    """Sanitize target objective input.
+sanitize_target_objective = partial(
+    sanitize_prompt_input,
+    max_length=MAX_TARGET_OBJECTIVE_LENGTH,
+    field_name="target objective",
+)
+sanitize_target_objective.__doc__ = """Sanitize target objective input.
 
-    Args:
-        text: User-provided target objective description
+Args:
+    text: User-provided target objective description
 
-    Returns:
-        Sanitized text or None
-    """
-    return sanitize_prompt_input(
-        text,
-        max_length=MAX_TARGET_OBJECTIVE_LENGTH,
-        field_name="target objective"
-    )
+Returns:
+    Sanitized text or None
+"""
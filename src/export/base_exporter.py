@@ -1,7 +1,9 @@
 """Base exporter class for multi-format export."""
 
+import os
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -11,6 +13,9 @@ from ..storage.user_storage import UserStorage
 from ..storage.version_storage import VersionStorage
 from .tag_parser import strip_semantic_tags
 
+# Worker cap for loading manual sections (file reads and path stats)
+_SECTION_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
 
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
@@ -129,33 +134,58 @@ class BaseExporter(ABC):
             sections.append(toc)
 
         # Chapters and manuals
-        chapters = self.project.get("chapters", [])
-        for chapter in sorted(chapters, key=lambda c: c.get("order", 0)):
+        chapters = sorted(self.project.get("chapters", []), key=lambda c: c.get("order", 0))
+        doc_ids = [doc_id for chapter in chapters for doc_id in chapter.get("manuals", [])]
+
+        # Manual sections are read from disk independently; map keeps project order
+        if len(doc_ids) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(doc_ids), _SECTION_WORKERS)) as executor:
+                manual_sections = list(executor.map(
+                    lambda doc_id: self._build_manual_section(doc_id, language), doc_ids
+                ))
+        else:
+            manual_sections = [self._build_manual_section(doc_id, language) for doc_id in doc_ids]
+        manual_sections = iter(manual_sections)
+
+        for chapter in chapters:
             # Chapter cover
             if include_chapter_covers:
                 cover = self._generate_chapter_cover(chapter)
                 sections.append(cover)
 
             # Chapter manuals
-            for doc_id in chapter.get("manuals", []):
-                doc_content = self._get_doc_content(doc_id, language)
-                if doc_content:
-                    # Add manual section with anchor
-                    anchor = slugify(doc_id)
-                    sections.append(f'<a name="{anchor}"></a>\n')
-                    sections.append('<div class="manual-section" markdown="1">\n')
-
-                    # Fix image paths to be absolute
-                    doc_content = self._fix_image_paths(doc_content, doc_id)
-                    sections.append(doc_content)
-
-                    sections.append('\n</div>\n')
-                else:
-                    sections.append(f"\n## {doc_id}\n")
-                    sections.append(f"*Manual not found for language: {language}*\n")
+            for _ in chapter.get("manuals", []):
+                sections.extend(next(manual_sections))
 
         return "\n".join(sections)
 
+    def _build_manual_section(self, doc_id: str, language: str) -> List[str]:
+        """Build the markdown pieces for one manual in the combined document.
+
+        Args:
+            doc_id: Manual identifier
+            language: Language code
+
+        Returns:
+            Section pieces, or a not-found notice if the manual has no content
+        """
+        doc_content = self._get_doc_content(doc_id, language)
+        if not doc_content:
+            return [
+                f"\n## {doc_id}\n",
+                f"*Manual not found for language: {language}*\n",
+            ]
+
+        # Add manual section with anchor
+        anchor = slugify(doc_id)
+        return [
+            f'<a name="{anchor}"></a>\n',
+            '<div class="manual-section" markdown="1">\n',
+            # Fix image paths to be absolute
+            self._fix_image_paths(doc_content, doc_id),
+            '\n</div>\n',
+        ]
+
     def _generate_toc(self) -> str:
         """Generate table of contents markdown."""
         lines = ['<div class="toc" markdown="1">\n']
@@ -1,11 +1,14 @@
 """Manual exporter for exporting individual manuals to various formats."""
 
+import os
 import re
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import base64
 
 import markdown
 from weasyprint import HTML, CSS
@@ -14,21 +17,123 @@ from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
 from ..storage.user_storage import UserStorage
+from .image_data import image_data_uri
 from .tag_parser import strip_semantic_tags
 
+# Markdown renderers are stateful and not thread-safe, so each thread keeps
+# one instance and resets it between documents instead of rebuilding it
+_markdown_local = threading.local()
+
+
+def _get_markdown() -> markdown.Markdown:
+    """Return this thread's reset Markdown renderer for document export."""
+    md = getattr(_markdown_local, "md", None)
+    if md is None:
+        md = markdown.Markdown(extensions=['extra', 'codehilite', 'tables', 'toc'])
+        _markdown_local.md = md
+    return md.reset()
+
+
+# App bundle stylesheets are only needed for browser preview; WeasyPrint would
+# fetch and parse them on every PDF render although DEFAULT_CSS covers print
+_BUNDLE_LINK_RE = re.compile(r'<link[^>]+href="[^"]*\.bundle[^"]*"[^>]*>')
+
+# Markdown image reference; the lazy alt text may span multiple lines and
+# contain brackets (e.g. "Click [Save]")
+_IMG_RE = re.compile(r'!\[([\s\S]*?)\]\(([^)]+)\)')
+
+# Image line in the Word parser, which only handles single-line alt text
+_WORD_IMG_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+# Magic bytes of image formats that are already compressed; deflating them
+# again in a ZIP costs CPU without shrinking the archive
+_COMPRESSED_IMAGE_SIGNATURES = (
+    b'\x89PNG\r\n\x1a\n',
+    b'\xff\xd8\xff',
+    b'GIF87a',
+    b'GIF89a',
+)
+
+
+def _is_precompressed_image(path: str) -> bool:
+    """Check a file's magic bytes for an already-compressed image format."""
+    with open(path, 'rb') as f:
+        head = f.read(12)
+    if head.startswith(_COMPRESSED_IMAGE_SIGNATURES):
+        return True
+    # WebP: RIFF container with a WEBP form type
+    return head[:4] == b'RIFF' and head[8:12] == b'WEBP'
+
+
+def _open_output(path: str, mode: str = 'wb', **kwargs):
+    """Open an export output file with a 1 MB write buffer.
+
+    Exports can run to many megabytes (embedded base64 images, PDFs), and
+    the default 8 KB buffer turns that into thousands of small writes.
+    """
+    return open(path, mode, buffering=1 << 20, **kwargs)
+
+
+@lru_cache(maxsize=8)
+def _pdf_stylesheet(css: str) -> CSS:
+    """Return the parsed WeasyPrint stylesheet for a CSS string.
+
+    Parsing happens once per distinct stylesheet instead of on every PDF
+    render; CSS objects are read-only once built and safe to share.
+    """
+    return CSS(string=css)
+
+
+_SLUG_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-')
+
+
+def _slug_char(char: str) -> str:
+    """Return the slug form of one character.
+
+    Whitespace and underscores become hyphens, letters are lowercased and
+    anything outside [a-z0-9-] is dropped.
+    """
+    if char.isspace() or char == '_':
+        return '-'
+    return ''.join(c for c in char.lower() if c in _SLUG_CHARS)
+
+
+class _SlugTable(dict):
+    """str.translate table mapping each character to its slug form.
+
+    ASCII is prebuilt; other code points are computed on each lookup and
+    not stored, so user input cannot grow the table.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        return _slug_char(chr(codepoint))
+
+
+_SLUG_TABLE = _SlugTable(str.maketrans({chr(codepoint): _slug_char(chr(codepoint)) for codepoint in range(128)}))
+
+_HYPHEN_RUN_RE = re.compile(r'-{2,}')
+
+# Line kinds for the Word markdown parser, told apart by match.lastgroup.
+# List and fence markers may be indented; the captured list text excludes
+# trailing whitespace, matching the stripped line the parser works from.
+_WORD_LINE_RE = re.compile(
+    r'(?P<level>#{1,4}) (?P<heading>.*)'
+    r'|(?P<image>!\[)'
+    r'|\s*(?:[-*] (?P<bullet>.*\S)|\d+\.\s(?P<number>.*\S)|(?P<fence>```))'
+)
+
 
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
-    text = text.lower()
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'[^a-z0-9\-]', '', text)
-    text = re.sub(r'-+', '-', text)
-    return text.strip('-')
+    text = text.translate(_SLUG_TABLE)
+    return _HYPHEN_RUN_RE.sub('-', text).strip('-')
 
 
 class BaseDocExporter(ABC):
     """Abstract base class for manual exporters."""
 
+    __slots__ = ('user_id', 'doc_id', 'user_storage')
+
     # File extension for this export format (e.g., 'pdf', 'docx', 'html')
     file_extension: str = ""
 
@@ -112,44 +217,54 @@ class BaseDocExporter(ABC):
         Returns:
             Content with fixed image paths
         """
+        return self._rewrite_images(content, embed=False)
+
+    def _rewrite_images(self, content: str, embed: bool = False) -> str:
+        """Rewrite local image references in a single regex pass.
+
+        Args:
+            content: Markdown content
+            embed: Embed images as base64 data URIs instead of
+                pointing at them with absolute file:// paths
+
+        Returns:
+            Content with rewritten image references
+        """
         screenshots_dir = self.user_storage.docs_dir / self.doc_id / "screenshots"
 
         def replace_path(match):
             # Normalize alt text (may span multiple lines)
-            alt = match.group(1).replace('\n', ' ').strip()
-            alt = re.sub(r'\s+', ' ', alt)
+            alt = ' '.join(match.group(1).split())
             path = match.group(2)
 
-            # Handle ../screenshots/ paths
-            if path.startswith("../screenshots/"):
-                filename = path.replace("../screenshots/", "")
-                abs_path = screenshots_dir / filename
-                if abs_path.exists():
-                    return f"![{alt}](file://{abs_path})"
-
-            # Handle screenshots/ paths
-            if path.startswith("screenshots/"):
-                filename = path.replace("screenshots/", "")
-                abs_path = screenshots_dir / filename
-                if abs_path.exists():
-                    return f"![{alt}](file://{abs_path})"
-
-            # Handle bare filenames
-            if not path.startswith(("http://", "https://", "file://", "/")):
-                abs_path = screenshots_dir / path
-                if abs_path.exists():
-                    return f"![{alt}](file://{abs_path})"
+            # Leave external URLs, data URIs and absolute paths untouched
+            if path.startswith(("http://", "https://", "data:", "file://", "/")):
+                return f"![{alt}]({path})"
 
-            return f"![{alt}]({path})"
+            # Resolve ../screenshots/, screenshots/ and bare filenames
+            filename = path
+            for prefix in ("../screenshots/", "screenshots/"):
+                if path.startswith(prefix):
+                    filename = path[len(prefix):]
+                    break
+            img_path = screenshots_dir / filename
+
+            try:
+                st = img_path.stat()
+                if embed:
+                    return f"![{alt}]({image_data_uri(str(img_path), st.st_mtime_ns, st.st_size)})"
+                return f"![{alt}](file://{img_path})"
+            except Exception:
+                return f"![{alt}]({path})"
 
-        # Use [\s\S]*? to match alt text that may span multiple lines
-        pattern = r'!\[([\s\S]*?)\]\(([^)]+)\)'
-        return re.sub(pattern, replace_path, content)
+        return _IMG_RE.sub(replace_path, content)
 
 
 class DocPDFExporter(BaseDocExporter):
     """Export manual to PDF format."""
 
+    __slots__ = ()
+
     file_extension = "pdf"
 
     # Default CSS for PDF export
@@ -304,6 +419,45 @@ blockquote {
         Returns:
             Path to generated PDF file
         """
+        document = self._render(language)
+
+        output_path = self._get_output_path(output_path, language)
+        with _open_output(output_path) as f:
+            document.write_pdf(f)
+
+        return output_path
+
+    def export_many(self, output_paths: list[str], language: str = "en") -> list[str]:
+        """Export manual to several PDF files from a single layout pass.
+
+        HTML parsing, the CSS cascade and page layout dominate PDF export
+        time, so the laid-out document is rendered once and written to
+        each path.
+
+        Args:
+            output_paths: Output file paths
+            language: Language code
+
+        Returns:
+            Paths to generated PDF files
+        """
+        document = self._render(language)
+
+        for output_path in output_paths:
+            with _open_output(output_path) as f:
+                document.write_pdf(f)
+
+        return output_paths
+
+    def _render(self, language: str):
+        """Lay out the manual as a WeasyPrint document.
+
+        Args:
+            language: Language code
+
+        Returns:
+            Rendered weasyprint Document, ready to be written as PDF
+        """
         # Get manual content
         content = self._get_manual_content(language)
         if not content:
@@ -335,8 +489,8 @@ blockquote {
 """
 
         # Convert markdown to HTML
-        md = markdown.Markdown(extensions=['extra', 'codehilite', 'tables', 'toc'])
-        html_content = md.convert(content)
+        html_content = _get_markdown().convert(content)
+        html_content = _BUNDLE_LINK_RE.sub("", html_content)
 
         # Wrap in HTML template
         html = f"""
@@ -353,19 +507,16 @@ blockquote {
 </html>
 """
 
-        # Generate PDF
-        output_path = self._get_output_path(output_path, language)
-        HTML(string=html).write_pdf(
-            output_path,
-            stylesheets=[CSS(string=self.DEFAULT_CSS)]
+        return HTML(string=html).render(
+            stylesheets=[_pdf_stylesheet(self.DEFAULT_CSS)]
         )
 
-        return output_path
-
 
 class DocWordExporter(BaseDocExporter):
     """Export manual to Word (DOCX) format."""
 
+    __slots__ = ()
+
     file_extension = "docx"
 
     def export(
@@ -408,8 +559,7 @@ class DocWordExporter(BaseDocExporter):
         doc.add_paragraph()  # Spacing
 
         # Convert markdown to HTML first, then parse
-        md = markdown.Markdown(extensions=['extra', 'codehilite', 'tables', 'toc'])
-        html_content = md.convert(content)
+        html_content = _get_markdown().convert(content)
 
         # Simple markdown parsing (basic implementation)
         # For a more robust solution, consider using a markdown parser
@@ -417,7 +567,8 @@ class DocWordExporter(BaseDocExporter):
 
         # Save document
         output_path = self._get_output_path(output_path, language)
-        doc.save(output_path)
+        with _open_output(output_path) as f:
+            doc.save(f)
 
         return output_path
 
@@ -429,23 +580,17 @@ class DocWordExporter(BaseDocExporter):
         """
         screenshots_dir = self.user_storage.docs_dir / self.doc_id / "screenshots"
 
-        lines = content.split('\n')
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        lines = iter(content.split('\n'))
+        for line in lines:
+            match = _WORD_LINE_RE.match(line)
+            kind = match.lastgroup if match else None
 
             # Headers
-            if line.startswith('# '):
-                doc.add_heading(line[2:], 1)
-            elif line.startswith('## '):
-                doc.add_heading(line[3:], 2)
-            elif line.startswith('### '):
-                doc.add_heading(line[4:], 3)
-            elif line.startswith('#### '):
-                doc.add_heading(line[5:], 4)
+            if kind == 'heading':
+                doc.add_heading(match.group('heading'), len(match.group('level')))
             # Images
-            elif line.startswith('!['):
-                match = re.match(r'!\[([^\]]*)\]\(([^)]+)\)', line)
+            elif kind == 'image':
+                match = _WORD_IMG_RE.match(line)
                 if match:
                     alt_text = match.group(1)
                     img_path = match.group(2)
@@ -486,19 +631,18 @@ class DocWordExporter(BaseDocExporter):
                             # If image fails to load, add alt text as paragraph
                             doc.add_paragraph(f"[Image: {alt_text}]")
             # Lists
-            elif line.strip().startswith('- ') or line.strip().startswith('* '):
-                doc.add_paragraph(line.strip()[2:], style='List Bullet')
-            elif re.match(r'^\d+\.\s', line.strip()):
-                text = re.sub(r'^\d+\.\s', '', line.strip())
-                doc.add_paragraph(text, style='List Number')
+            elif kind == 'bullet':
+                doc.add_paragraph(match.group('bullet'), style='List Bullet')
+            elif kind == 'number':
+                doc.add_paragraph(match.group('number'), style='List Number')
             # Code blocks
-            elif line.strip().startswith('```'):
+            elif kind == 'fence':
                 # Collect code block
                 code_lines = []
-                i += 1
-                while i < len(lines) and not lines[i].strip().startswith('```'):
-                    code_lines.append(lines[i])
-                    i += 1
+                for code_line in lines:
+                    if code_line.strip().startswith('```'):
+                        break
+                    code_lines.append(code_line)
                 if code_lines:
                     code_para = doc.add_paragraph()
                     code_run = code_para.add_run('\n'.join(code_lines))
@@ -511,12 +655,12 @@ class DocWordExporter(BaseDocExporter):
             elif line.strip():
                 doc.add_paragraph(line)
 
-            i += 1
-
 
 class DocHTMLExporter(BaseDocExporter):
     """Export manual to standalone HTML format."""
 
+    __slots__ = ()
+
     file_extension = "html"
 
     # Default CSS for HTML export
@@ -716,8 +860,7 @@ a:hover {
 """
 
         # Convert markdown to HTML
-        md = markdown.Markdown(extensions=['extra', 'codehilite', 'tables', 'toc'])
-        html_content = md.convert(content)
+        html_content = _get_markdown().convert(content)
 
         # Wrap in HTML template
         html = f"""<!DOCTYPE html>
@@ -739,7 +882,7 @@ a:hover {
 
         # Save HTML
         output_path = self._get_output_path(output_path, language)
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with _open_output(output_path, 'w', encoding='utf-8') as f:
             f.write(html)
 
         return output_path
@@ -753,58 +896,14 @@ a:hover {
         Returns:
             Content with embedded images
         """
-        screenshots_dir = self.user_storage.docs_dir / self.doc_id / "screenshots"
-
-        def replace_path(match):
-            alt = match.group(1).replace('\n', ' ').strip()
-            alt = re.sub(r'\s+', ' ', alt)
-            path = match.group(2)
-
-            # Skip external URLs
-            if path.startswith(("http://", "https://", "data:")):
-                return f"![{alt}]({path})"
-
-            # Resolve local path
-            img_path = None
-            if path.startswith("../screenshots/"):
-                img_path = screenshots_dir / path.replace("../screenshots/", "")
-            elif path.startswith("screenshots/"):
-                img_path = screenshots_dir / path.replace("screenshots/", "")
-            elif not path.startswith(("file://", "/")):
-                img_path = screenshots_dir / path
-
-            # Embed as base64 if file exists
-            if img_path and img_path.exists():
-                try:
-                    with open(img_path, 'rb') as f:
-                        img_data = f.read()
-                    b64_data = base64.b64encode(img_data).decode('utf-8')
-
-                    # Determine MIME type from extension
-                    ext = img_path.suffix.lower()
-                    mime_types = {
-                        '.png': 'image/png',
-                        '.jpg': 'image/jpeg',
-                        '.jpeg': 'image/jpeg',
-                        '.gif': 'image/gif',
-                        '.svg': 'image/svg+xml',
-                        '.webp': 'image/webp',
-                    }
-                    mime_type = mime_types.get(ext, 'image/png')
-
-                    return f"![{alt}](data:{mime_type};base64,{b64_data})"
-                except Exception:
-                    pass
-
-            return f"![{alt}]({path})"
-
-        pattern = r'!\[([\s\S]*?)\]\(([^)]+)\)'
-        return re.sub(pattern, replace_path, content)
+        return self._rewrite_images(content, embed=True)
 
 
 class DocMarkdownExporter(BaseDocExporter):
     """Export manual to Markdown format as a ZIP with images."""
 
+    __slots__ = ()
+
     file_extension = "zip"
 
     def export(
@@ -835,15 +934,36 @@ class DocMarkdownExporter(BaseDocExporter):
         if not content:
             raise ValueError(f"Manual content not found for language: {language}")
 
-        # Get screenshots directory
+        # List the screenshots directory once instead of stat-ing each reference
         screenshots_dir = self.user_storage.docs_dir / self.doc_id / "screenshots"
+        try:
+            with os.scandir(screenshots_dir) as entries:
+                screenshots = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            screenshots = {}
+
+        def find_screenshot(filename):
+            if filename in screenshots:
+                return True
+            # Nested references (e.g. sub/x.png) are not in the top-level
+            # listing; stat them directly, but only inside screenshots_dir
+            if '/' not in filename:
+                return False
+            img_path = screenshots_dir / filename
+            try:
+                inside = img_path.resolve().is_relative_to(screenshots_dir.resolve())
+                if not (inside and img_path.is_file()):
+                    return False
+            except OSError:
+                return False
+            screenshots[filename] = str(img_path)
+            return True
 
         # Collect referenced images and rewrite paths
         referenced_images = set()
 
         def rewrite_image_path(match):
-            alt = match.group(1).replace('\n', ' ').strip()
-            alt = re.sub(r'\s+', ' ', alt)
+            alt = ' '.join(match.group(1).split())
             path = match.group(2)
 
             # Skip external URLs
@@ -859,37 +979,46 @@ class DocMarkdownExporter(BaseDocExporter):
             elif not path.startswith(("file://", "/")):
                 filename = path
 
-            if filename:
-                # Check if file exists
-                img_path = screenshots_dir / filename
-                if img_path.exists():
-                    referenced_images.add(filename)
-                    # Rewrite to relative path within ZIP
-                    return f"![{alt}](./images/{filename})"
+            if filename and find_screenshot(filename):
+                referenced_images.add(filename)
+                # Rewrite to relative path within ZIP
+                return f"![{alt}](./images/{filename})"
 
             return f"![{alt}]({path})"
 
-        pattern = r'!\[([\s\S]*?)\]\(([^)]+)\)'
-        processed_content = re.sub(pattern, rewrite_image_path, content)
+        processed_content = _IMG_RE.sub(rewrite_image_path, content)
 
         # Generate output path
         output_path = self._get_output_path(output_path, language)
 
         # Create ZIP file
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with _open_output(output_path) as f, zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # Add markdown file
             md_filename = f"{self.doc_id}.md"
             zipf.writestr(md_filename, processed_content)
 
-            # Add referenced images to images/ folder
+            # Add referenced images to images/ folder, streamed from disk
             for img_filename in referenced_images:
-                img_path = screenshots_dir / img_filename
-                if img_path.exists():
-                    zipf.write(img_path, f"images/{img_filename}")
+                img_path = screenshots[img_filename]
+                compress_type = None
+                if _is_precompressed_image(img_path):
+                    compress_type = zipfile.ZIP_STORED
+                zipf.write(img_path, f"images/{img_filename}", compress_type=compress_type)
 
         return output_path
 
 
+# Export format names (lowercase) to exporter classes
+_EXPORTERS: dict[str, type[BaseDocExporter]] = {
+    'pdf': DocPDFExporter,
+    'word': DocWordExporter,
+    'docx': DocWordExporter,
+    'html': DocHTMLExporter,
+    'markdown': DocMarkdownExporter,
+    'md': DocMarkdownExporter,
+}
+
+
 def create_doc_exporter(user_id: str, doc_id: str, format: str) -> BaseDocExporter:
     """Factory function to create appropriate exporter.
 
@@ -904,17 +1033,59 @@ def create_doc_exporter(user_id: str, doc_id: str, format: str) -> BaseDocExport
     Raises:
         ValueError: If format is not supported
     """
-    exporters = {
-        'pdf': DocPDFExporter,
-        'word': DocWordExporter,
-        'docx': DocWordExporter,
-        'html': DocHTMLExporter,
-        'markdown': DocMarkdownExporter,
-        'md': DocMarkdownExporter,
-    }
-
-    exporter_class = exporters.get(format.lower())
+    exporter_class = _EXPORTERS.get(format.lower())
     if not exporter_class:
         raise ValueError(f"Unsupported export format: {format}")
 
     return exporter_class(user_id, doc_id)
+
+
+def bulk_export(
+    user_id: str,
+    doc_id: str,
+    formats: list[str],
+    language: str = "en",
+    **options,
+) -> dict[str, str]:
+    """Export a manual to several formats concurrently.
+
+    Each format runs on its own thread; WeasyPrint, Pillow and zlib release
+    the GIL in their C paths, so the batch takes about as long as the
+    slowest format. Aliases of the same format (e.g. 'word' and 'docx')
+    share a single export. Output paths are always generated, since one
+    explicit path cannot hold several formats.
+
+    Args:
+        user_id: User identifier
+        doc_id: Manual identifier
+        formats: Export formats (see create_doc_exporter)
+        language: Language code for manual content
+        **options: Format-specific options passed to every exporter
+
+    Returns:
+        Mapping of each requested format to its generated file path
+
+    Raises:
+        ValueError: If any format is not supported
+    """
+    # Build every exporter first so an invalid format fails before any work
+    jobs: dict[type, tuple[BaseDocExporter, list[str]]] = {}
+    for fmt in formats:
+        exporter = create_doc_exporter(user_id, doc_id, fmt)
+        jobs.setdefault(type(exporter), (exporter, []))[1].append(fmt)
+
+    if not jobs:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+        futures = {
+            executor.submit(exporter.export, language=language, **options): fmts
+            for exporter, fmts in jobs.values()
+        }
+        for future, fmts in futures.items():
+            path = future.result()
+            for fmt in fmts:
+                results[fmt] = path
+
+    return results
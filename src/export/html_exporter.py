@@ -1,229 +1,93 @@
 """HTML exporter for projects - standalone HTML with embedded images."""
 
-import base64
-import mimetypes
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from importlib import resources
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import markdown
 
 from .base_exporter import BaseExporter
+from .image_data import image_data_uri
 
 
-# Default CSS for HTML export
-DEFAULT_HTML_CSS = """
-body {
-    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-    font-size: 16px;
-    line-height: 1.6;
-    color: #333;
-    max-width: 900px;
-    margin: 0 auto;
-    padding: 20px 40px;
-    background-color: #fff;
-}
-
-h1 {
-    font-size: 2.5em;
-    color: #1a365d;
-    border-bottom: 3px solid #1a365d;
-    padding-bottom: 10px;
-    margin-top: 40px;
-}
-
-h1:first-of-type {
-    margin-top: 0;
-}
-
-h2 {
-    font-size: 1.8em;
-    color: #2c5282;
-    margin-top: 35px;
-    border-bottom: 1px solid #e2e8f0;
-    padding-bottom: 8px;
-}
-
-h3 {
-    font-size: 1.4em;
-    color: #2d3748;
-    margin-top: 30px;
-}
-
-h4 {
-    font-size: 1.2em;
-    color: #4a5568;
-    margin-top: 25px;
-}
-
-p {
-    margin: 15px 0;
-}
-
-img {
-    max-width: 100%;
-    height: auto;
-    display: block;
-    margin: 20px auto;
-    border: 1px solid #e2e8f0;
-    border-radius: 8px;
-    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-}
-
-code {
-    background-color: #f7fafc;
-    padding: 3px 8px;
-    border-radius: 4px;
-    font-family: "SF Mono", Monaco, "Courier New", monospace;
-    font-size: 0.9em;
-    color: #c7254e;
-}
-
-pre {
-    background-color: #f7fafc;
-    padding: 20px;
-    border-radius: 8px;
-    overflow-x: auto;
-    border: 1px solid #e2e8f0;
-}
-
-pre code {
-    padding: 0;
-    background: none;
-    color: inherit;
-}
-
-ul, ol {
-    margin: 15px 0;
-    padding-left: 30px;
-}
-
-li {
-    margin: 8px 0;
-}
-
-blockquote {
-    border-left: 4px solid #4299e1;
-    margin: 20px 0;
-    padding: 15px 25px;
-    background-color: #ebf8ff;
-    border-radius: 0 8px 8px 0;
-    font-style: italic;
-}
-
-table {
-    width: 100%;
-    border-collapse: collapse;
-    margin: 20px 0;
-}
-
-th, td {
-    border: 1px solid #e2e8f0;
-    padding: 12px 15px;
-    text-align: left;
-}
-
-th {
-    background-color: #f7fafc;
-    font-weight: 600;
-}
-
-tr:nth-child(even) {
-    background-color: #f9fafb;
-}
-
-hr {
-    border: none;
-    border-top: 2px solid #e2e8f0;
-    margin: 40px 0;
-}
-
-a {
-    color: #3182ce;
-    text-decoration: none;
-}
-
-a:hover {
-    text-decoration: underline;
-}
-
-/* Manual section styling */
-.manual-section {
-    margin-top: 50px;
-    padding-top: 30px;
-    border-top: 2px solid #e2e8f0;
-}
-
-/* Chapter cover styling */
-.chapter-cover {
-    text-align: center;
-    padding: 60px 20px;
-    margin: 40px 0;
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    color: white;
-    border-radius: 12px;
-}
-
-.chapter-cover h2 {
-    color: white;
-    border: none;
-    font-size: 2em;
-}
-
-.chapter-cover p {
-    color: rgba(255,255,255,0.9);
-}
-
-/* TOC styling */
-.toc {
-    background-color: #f8fafc;
-    padding: 30px;
-    border-radius: 12px;
-    margin: 30px 0;
-}
-
-.toc h1 {
-    margin-top: 0;
-    font-size: 1.5em;
-    border: none;
-}
-
-.toc ul {
-    list-style: none;
-    padding-left: 0;
-}
-
-.toc li {
-    margin: 10px 0;
-}
-
-.toc .chapter {
-    font-weight: 600;
-    font-size: 1.1em;
-    margin-top: 20px;
-}
-
-.toc .manual {
-    padding-left: 25px;
-}
-
-/* Print styles */
-@media print {
-    body {
-        max-width: none;
-        padding: 0;
-    }
-
-    .manual-section {
-        page-break-before: always;
-    }
-
-    .chapter-cover {
-        page-break-before: always;
-        page-break-after: always;
-    }
-}
-"""
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r'\s+')
+_CSS_LAST_SEMICOLON_RE = re.compile(r';\s*}')
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments, collapse whitespace and drop semicolons before '}'."""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_WHITESPACE_RE.sub(' ', css)
+    return _CSS_LAST_SEMICOLON_RE.sub(' }', css).strip()
+
+
+# Default CSS for HTML export. Edit the readable source in default_html.css;
+# it is minified once at import since every exported document embeds it.
+DEFAULT_HTML_CSS = _minify_css(
+    resources.files(__package__).joinpath("default_html.css").read_text(encoding="utf-8")
+)
+
+# src attributes pointing at file:// URLs or local image files
+_IMG_SRC_RE = re.compile(
+    r'src="(file://[^"]+|[^"]+\.(?:png|jpg|jpeg|gif|webp|svg))"',
+    re.IGNORECASE,
+)
+
+
+# Upper bound on threads reading and encoding images for one document
+_EMBED_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+# Rendered HTML keyed by a blake2b digest of the markdown source, so repeated
+# exports of unchanged content skip conversion without keeping the (possibly
+# large) source strings alive as cache keys. Whole project documents are
+# cached, so the cache is bounded by their total length, not entry count.
+_HTML_CACHE_MAX_BYTES = 16 * 1024 * 1024
+_html_cache: OrderedDict[bytes, str] = OrderedDict()
+_html_cache_bytes = 0
+_html_cache_lock = threading.Lock()
+
+
+# Markdown renderers are stateful and not thread-safe, so each thread keeps
+# one instance and resets it between conversions instead of rebuilding it
+_markdown_local = threading.local()
+
+
+def _get_markdown() -> markdown.Markdown:
+    """Return this thread's reset Markdown renderer for project export."""
+    md = getattr(_markdown_local, "md", None)
+    if md is None:
+        md = markdown.Markdown(
+            extensions=[
+                'tables',
+                'fenced_code',
+                'codehilite',
+                'toc',
+                'nl2br',
+                'md_in_html',
+            ],
+            extension_configs={
+                'codehilite': {
+                    'css_class': 'highlight',
+                    'guess_lang': False,
+                }
+            },
+        )
+        _markdown_local.md = md
+    return md.reset()
+
+
+def _markdown_digest(md_content: str) -> bytes:
+    """Return the cache key for a markdown source."""
+    data = md_content.encode('utf-8', 'surrogatepass')
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 class HTMLExporter(BaseExporter):
@@ -271,77 +135,124 @@ class HTMLExporter(BaseExporter):
 
         # Build full HTML document
         css = custom_css or DEFAULT_HTML_CSS
-        html_doc = self._build_html_document(html_body, css)
+        html_parts = self._html_document_parts(html_body, css)
 
-        # Write to file
-        Path(output_path).write_text(html_doc, encoding='utf-8')
+        # Write to file without joining the pieces in memory first; each
+        # piece is encoded to UTF-8 once and handed over as a single write
+        with open(output_path, 'wb') as f:
+            f.writelines(part.encode('utf-8') for part in html_parts)
 
         return output_path
 
     def _convert_markdown_to_html(self, md_content: str) -> str:
-        """Convert markdown to HTML."""
-        extensions = [
-            'tables',
-            'fenced_code',
-            'codehilite',
-            'toc',
-            'nl2br',
-            'md_in_html',
-        ]
-
-        return markdown.markdown(
-            md_content,
-            extensions=extensions,
-            extension_configs={
-                'codehilite': {
-                    'css_class': 'highlight',
-                    'guess_lang': False,
-                }
-            }
-        )
+        """Convert markdown to HTML, reusing cached output for unchanged sources."""
+        global _html_cache_bytes
+
+        key = _markdown_digest(md_content)
+        with _html_cache_lock:
+            html = _html_cache.get(key)
+            if html is not None:
+                _html_cache.move_to_end(key)
+                return html
+
+        html = self._render_markdown(md_content)
+
+        # Documents larger than the whole budget are returned without caching
+        if len(html) <= _HTML_CACHE_MAX_BYTES:
+            with _html_cache_lock:
+                if key not in _html_cache:
+                    _html_cache[key] = html
+                    _html_cache_bytes += len(html)
+                    while _html_cache_bytes > _HTML_CACHE_MAX_BYTES:
+                        _, evicted = _html_cache.popitem(last=False)
+                        _html_cache_bytes -= len(evicted)
+        return html
+
+    def _render_markdown(self, md_content: str) -> str:
+        """Run the markdown-to-HTML conversion."""
+        return _get_markdown().convert(md_content)
 
     def _embed_images(self, html_content: str) -> str:
         """Embed images as base64 data URIs.
 
+        Distinct images are read and encoded concurrently; file reads and
+        pybase64's encoder release the GIL.
+
         Args:
             html_content: HTML content with image tags
 
         Returns:
             HTML content with embedded images
         """
-        def replace_image(match):
+        # Documents without screenshots are common; skip the regex walk
+        if 'src="' not in html_content:
+            return html_content
+
+        matches = list(_IMG_SRC_RE.finditer(html_content))
+        if not matches:
+            return html_content
+
+        # Resolve each distinct src to its file identity first, so a file
+        # referenced as both "path" and "file://path" is encoded by one job
+        src_keys = {}
+        for match in matches:
             src = match.group(1)
+            if src not in src_keys:
+                src_keys[src] = self._image_key(src)
+        keys = list(dict.fromkeys(key for key in src_keys.values() if key is not None))
+
+        if len(keys) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(keys), _EMBED_WORKERS)) as executor:
+                encoded = dict(zip(keys, executor.map(self._encode_image, keys)))
+        else:
+            encoded = {key: self._encode_image(key) for key in keys}
+        data_uris = {src: encoded.get(key) for src, key in src_keys.items()}
+
+        # Splice the results back in a single join
+        parts = []
+        pos = 0
+        for match in matches:
+            parts.append(html_content[pos:match.start()])
+            data_uri = data_uris[match.group(1)]
+            parts.append(f'src="{data_uri}"' if data_uri else match.group(0))
+            pos = match.end()
+        parts.append(html_content[pos:])
+        return ''.join(parts)
+
+    def _image_key(self, src: str) -> Optional[Tuple[str, int, int]]:
+        """Resolve an image src to its (path, mtime_ns, size) identity.
 
-            # Handle file:// URLs
-            if src.startswith('file://'):
-                img_path = Path(src.replace('file://', ''))
-            else:
-                img_path = Path(src)
-
-            if img_path.exists():
-                try:
-                    # Read image and convert to base64
-                    with open(img_path, 'rb') as f:
-                        img_data = f.read()
+        Args:
+            src: Image path or file:// URL
 
-                    # Get MIME type
-                    mime_type, _ = mimetypes.guess_type(str(img_path))
-                    if not mime_type:
-                        mime_type = 'image/png'
+        Returns:
+            File identity, or None if the image cannot be found
+        """
+        # Handle file:// URLs
+        if src.startswith('file://'):
+            img_path = Path(src.replace('file://', ''))
+        else:
+            img_path = Path(src)
 
-                    # Create data URI
-                    b64_data = base64.b64encode(img_data).decode('utf-8')
-                    data_uri = f'data:{mime_type};base64,{b64_data}'
+        try:
+            st = img_path.stat()
+        except Exception:
+            return None
+        return str(img_path), st.st_mtime_ns, st.st_size
 
-                    return f'src="{data_uri}"'
-                except Exception:
-                    pass
+    def _encode_image(self, key: Tuple[str, int, int]) -> Optional[str]:
+        """Build the base64 data URI for a resolved image.
 
-            return match.group(0)
+        Args:
+            key: File identity from _image_key
 
-        # Replace file:// URLs with base64 data URIs
-        pattern = r'src="(file://[^"]+|[^"]+\.(?:png|jpg|jpeg|gif|webp|svg))"'
-        return re.sub(pattern, replace_image, html_content, flags=re.IGNORECASE)
+        Returns:
+            Data URI, or None if the image cannot be read
+        """
+        try:
+            return image_data_uri(*key)
+        except Exception:
+            return None
 
     def _build_html_document(self, body: str, css: str) -> str:
         """Build complete HTML document.
@@ -353,17 +264,38 @@ class HTMLExporter(BaseExporter):
         Returns:
             Complete HTML document
         """
-        return f"""<!DOCTYPE html>
+        return ''.join(self._html_document_parts(body, css))
+
+    def _html_document_parts(self, body: str, css: str) -> list[str]:
+        """Build the complete HTML document as a list of string pieces.
+
+        The body can run to many megabytes once images are embedded, so
+        export writes these pieces directly instead of joining them first.
+
+        Args:
+            body: HTML body content
+            css: CSS styles
+
+        Returns:
+            Document pieces in order
+        """
+        return [
+            f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{self.project['name']}</title>
     <style>
-{css}
+""",
+            css,
+            """
     </style>
 </head>
 <body>
-{body}
+""",
+            body,
+            """
 </body>
-</html>"""
+</html>""",
+        ]
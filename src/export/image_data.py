@@ -0,0 +1,94 @@
+"""Base64 data URIs for images embedded in exported documents.
+
+Shared by the project and manual exporters so that one size-bounded cache
+holds the encoded screenshots for the whole process.
+"""
+
+import mimetypes
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+    from pybase64 import b64encode as _b64encode  # SIMD-accelerated
+except ImportError:  # Optional: falls back to the stdlib encoder
+    from base64 import b64encode as _b64encode
+
+
+_IMAGE_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp',
+}
+
+# Encoded screenshots often run to several MB each, so the cache is bounded
+# by the total length of the data URIs it holds rather than by entry count
+_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_cache: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+
+
+def _encode_file(path: str) -> str:
+    """Base64-encode a file straight from a memory map.
+
+    The encoder reads the mapped pages directly, so the file is never held
+    as a bytes object next to its base64 form.
+    """
+    with open(path, 'rb') as f:
+        # Zero-length files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _b64encode(mm).decode('ascii')
+
+
+def _mime_type(path: str) -> str:
+    """Return the MIME type for an image path, defaulting to PNG."""
+    mime_type = _IMAGE_MIME_TYPES.get(Path(path).suffix.lower())
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type(path)
+    return mime_type or 'image/png'
+
+
+def image_data_uri(path: str, mtime_ns: int, size: int) -> str:
+    """Return a base64 data URI for an image file.
+
+    Keyed on file identity (path, mtime, size) so a screenshot shared by
+    several documents, or re-exported unchanged, is encoded only once while
+    it stays in the cache, and a rewritten file is always re-encoded.
+
+    Args:
+        path: Image file path
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Data URI with the image's MIME type
+    """
+    global _cache_bytes
+
+    key = (path, mtime_ns, size)
+    with _cache_lock:
+        data_uri = _cache.get(key)
+        if data_uri is not None:
+            _cache.move_to_end(key)
+            return data_uri
+
+    data_uri = f'data:{_mime_type(path)};base64,{_encode_file(path)}'
+
+    # Images larger than the whole budget are returned without caching
+    if len(data_uri) <= _CACHE_MAX_BYTES:
+        with _cache_lock:
+            if key not in _cache:
+                _cache[key] = data_uri
+                _cache_bytes += len(data_uri)
+                while _cache_bytes > _CACHE_MAX_BYTES:
+                    _, evicted = _cache.popitem(last=False)
+                    _cache_bytes -= len(evicted)
+    return data_uri
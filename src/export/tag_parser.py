@@ -7,7 +7,10 @@ Used for:
 - Getting tag positions for syntax highlighting
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
@@ -85,11 +88,21 @@ def parse_attributes(attr_string: str) -> dict[str, str]:
     return dict(ATTRIBUTE_PATTERN.findall(attr_string))
 
 
+# Stripped documents keyed by a blake2b digest of the source, so the same
+# document exported to several formats in a row skips the regex walk without
+# keeping whole manuals alive as cache keys. Bounded by total result length.
+_STRIP_CACHE_MAX_BYTES = 4 * 1024 * 1024
+_strip_cache: OrderedDict[bytes, str] = OrderedDict()
+_strip_cache_bytes = 0
+_strip_cache_lock = threading.Lock()
+
+
 def strip_semantic_tags(content: str) -> str:
     """Remove semantic tags, keeping only the markdown content.
 
     This is used for web view rendering where we want clean markdown
-    without any XML-like tags visible.
+    without any XML-like tags visible. Results are cached because the
+    same document is often exported to several formats in a row.
 
     Args:
         content: Markdown content wrapped in semantic tags
@@ -97,6 +110,31 @@ def strip_semantic_tags(content: str) -> str:
     Returns:
         Clean markdown with all semantic tags removed
     """
+    global _strip_cache_bytes
+
+    key = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    with _strip_cache_lock:
+        result = _strip_cache.get(key)
+        if result is not None:
+            _strip_cache.move_to_end(key)
+            return result
+
+    result = _strip_tags(content)
+
+    # Documents larger than the whole budget are returned without caching
+    if len(result) <= _STRIP_CACHE_MAX_BYTES:
+        with _strip_cache_lock:
+            if key not in _strip_cache:
+                _strip_cache[key] = result
+                _strip_cache_bytes += len(result)
+                while _strip_cache_bytes > _STRIP_CACHE_MAX_BYTES:
+                    _, evicted = _strip_cache.popitem(last=False)
+                    _strip_cache_bytes -= len(evicted)
+    return result
+
+
+def _strip_tags(content: str) -> str:
+    """Run the tag-stripping regex passes over content."""
     # Remove opening tags with optional attributes
     result = OPENING_TAG_PATTERN.sub('', content)
     # Remove closing tags
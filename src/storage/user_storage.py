@@ -46,6 +46,10 @@ class UserStorage:
                     screenshots/
     """
 
+    # User dirs already created in this process, keyed by full path so a
+    # patched USERS_DIR (tests) still gets its own folders
+    _ensured_user_dirs: set[Path] = set()
+
     def __init__(self, user_id: str):
         """Initialize user storage.
 
@@ -58,9 +62,16 @@ class UserStorage:
         self.docs_dir = self.user_dir / "docs"
 
     def ensure_user_folders(self) -> None:
-        """Create user folder structure if it doesn't exist."""
+        """Create user folder structure if it doesn't exist.
+
+        Only the first call per user folder in a process touches the
+        filesystem; user folders are never removed by the app.
+        """
+        if self.user_dir in UserStorage._ensured_user_dirs:
+            return
         self.videos_dir.mkdir(parents=True, exist_ok=True)
         self.docs_dir.mkdir(parents=True, exist_ok=True)
+        UserStorage._ensured_user_dirs.add(self.user_dir)
 
     def find_existing_doc(self, video_name: str) -> Optional[str]:
         """Find an existing doc for a video name.
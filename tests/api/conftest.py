@@ -13,6 +13,22 @@ from httpx import ASGITransport, AsyncClient
 os.environ["ENVIRONMENT"] = "test"
 
 
+def _require_keys(data: dict, **types: type) -> None:
+    """Assert that each key is present in data with the given type."""
+    for key, expected_type in types.items():
+        value = data[key]
+        assert isinstance(value, expected_type), (key, type(value))
+
+
+@pytest.fixture(scope="session")
+def require_keys():
+    """Return a helper asserting response keys and their types.
+
+    Usage: ``require_keys(response.json(), projects=list, total=int)``
+    """
+    return _require_keys
+
+
 @pytest.fixture
 def test_db_path(tmp_data_dir: Path) -> Path:
     """Create a temporary database path for tests."""
@@ -223,3 +239,27 @@ def mock_storage_with_project(test_storage, sample_project_data: dict):
     )
 
     return test_storage, project_storage, project_id
+
+
+@pytest.fixture(scope="session")
+def default_project_id() -> str:
+    """Return the fixed ID of the per-user default project."""
+    from src.storage.project_storage import DEFAULT_PROJECT_ID
+
+    return DEFAULT_PROJECT_ID
+
+
+@pytest.fixture
+async def scratch_project(client: AsyncClient) -> AsyncGenerator[str, None]:
+    """Create a throwaway project via the API and delete it afterwards."""
+    response = await client.post(
+        "/api/projects",
+        json={"name": "Scratch Project", "description": ""},
+    )
+    assert response.status_code == 200
+    project_id = response.json()["id"]
+
+    yield project_id
+
+    # Tests may already have moved it to trash; ignore the outcome here
+    await client.delete(f"/api/projects/{project_id}")
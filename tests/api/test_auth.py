@@ -1,10 +1,8 @@
 """Tests for authentication routes."""
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_login(client: AsyncClient):
     """Test user login creates session and user folder."""
     response = await client.post(
@@ -19,7 +17,6 @@ async def test_login(client: AsyncClient):
     assert "session_user_id" in response.cookies
 
 
-@pytest.mark.asyncio
 async def test_login_empty_user_id(client: AsyncClient):
     """Test login with empty user_id returns validation error."""
     response = await client.post(
@@ -29,7 +26,6 @@ async def test_login_empty_user_id(client: AsyncClient):
     assert response.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
 async def test_logout(client: AsyncClient):
     """Test logout clears session cookie."""
     response = await client.post("/api/auth/logout")
@@ -38,7 +34,6 @@ async def test_logout(client: AsyncClient):
     assert data["status"] == "logged_out"
 
 
-@pytest.mark.asyncio
 async def test_me_authenticated(client: AsyncClient, test_user_id: str):
     """Test /me endpoint returns user info when authenticated."""
     response = await client.get("/api/auth/me")
@@ -49,7 +44,6 @@ async def test_me_authenticated(client: AsyncClient, test_user_id: str):
     assert "role" in data
 
 
-@pytest.mark.asyncio
 async def test_me_unauthenticated(unauthenticated_client: AsyncClient):
     """Test /me endpoint returns unauthenticated when no session."""
     response = await unauthenticated_client.get("/api/auth/me")
@@ -59,7 +53,6 @@ async def test_me_unauthenticated(unauthenticated_client: AsyncClient):
     assert "user_id" not in data
 
 
-@pytest.mark.asyncio
 async def test_login_returns_role(client: AsyncClient):
     """Test that login returns user role."""
     response = await client.post(
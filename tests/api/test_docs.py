@@ -5,11 +5,9 @@ test fixture isolation issues with patched config values. Full integration
 testing would require changes to the test infrastructure.
 """
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_list_docs_empty(client: AsyncClient):
     """Test listing documents when none exist."""
     response = await client.get("/api/docs")
@@ -20,7 +18,6 @@ async def test_list_docs_empty(client: AsyncClient):
     assert isinstance(data["docs"], list)
 
 
-@pytest.mark.asyncio
 async def test_get_doc_not_found(client: AsyncClient):
     """Test getting non-existent document returns 404."""
     response = await client.get("/api/docs/nonexistent-doc")
@@ -28,7 +25,6 @@ async def test_get_doc_not_found(client: AsyncClient):
     assert "Doc not found" in response.json()["detail"]
 
 
-@pytest.mark.asyncio
 async def test_update_doc_not_found(client: AsyncClient):
     """Test updating non-existent document returns 404."""
     response = await client.put(
@@ -38,28 +34,24 @@ async def test_update_doc_not_found(client: AsyncClient):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_delete_doc_not_found(client: AsyncClient):
     """Test deleting non-existent document returns 404."""
     response = await client.delete("/api/docs/nonexistent-doc")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_get_doc_languages_not_found(client: AsyncClient):
     """Test getting languages for non-existent doc returns 404."""
     response = await client.get("/api/docs/nonexistent-doc/languages")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_get_screenshot_not_found_no_doc(client: AsyncClient):
     """Test getting screenshot for non-existent doc returns 404."""
     response = await client.get("/api/docs/nonexistent-doc/screenshots/test.png")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_update_doc_title_not_found(client: AsyncClient):
     """Test updating title for non-existent doc returns 404."""
     response = await client.put(
@@ -69,21 +61,18 @@ async def test_update_doc_title_not_found(client: AsyncClient):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_get_doc_versions_not_found(client: AsyncClient):
     """Test getting versions for non-existent doc returns 404."""
     response = await client.get("/api/docs/nonexistent-doc/versions")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_delete_screenshot_not_found(client: AsyncClient):
     """Test deleting screenshot for non-existent doc returns 404."""
     response = await client.delete("/api/docs/nonexistent-doc/screenshots/test.png")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_docs_endpoint_returns_proper_structure(client: AsyncClient):
     """Test that docs list endpoint returns proper structure."""
     response = await client.get("/api/docs")
@@ -93,7 +82,6 @@ async def test_docs_endpoint_returns_proper_structure(client: AsyncClient):
     assert isinstance(data["docs"], list)
 
 
-@pytest.mark.asyncio
 async def test_update_doc_content_validation(client: AsyncClient):
     """Test that update doc requires content and language."""
     # Missing content field
@@ -104,7 +92,6 @@ async def test_update_doc_content_validation(client: AsyncClient):
     assert response.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_update_doc_title_validation(client: AsyncClient):
     """Test that update title requires title field."""
     response = await client.put(
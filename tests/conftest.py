@@ -1,7 +1,6 @@
 """Global test fixtures for vDocs backend tests."""
 
 import os
-import shutil
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -9,18 +8,24 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+# Prefer a RAM-backed temp root so filesystem-heavy tests skip disk I/O
+_TMPBASE = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
 # Set test environment before importing app modules
 os.environ["ENVIRONMENT"] = "test"
-os.environ["VDOCS_DATA_DIR"] = tempfile.mkdtemp()
+os.environ["VDOCS_DATA_DIR"] = tempfile.mkdtemp(prefix="vdocs_data_", dir=_TMPBASE)
+
+# Route tmp_path/tmp_path_factory to the same root (--basetemp still wins)
+if _TMPBASE:
+    os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", _TMPBASE)
 
 
 @pytest.fixture(scope="session")
 def test_data_dir() -> Generator[Path, None, None]:
     """Create a temporary data directory for the test session."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="vdocs_test_"))
-    yield temp_dir
-    # Cleanup after all tests
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    # Cleaned up automatically after all tests
+    with tempfile.TemporaryDirectory(prefix="vdocs_test_", dir=_TMPBASE) as temp_dir:
+        yield Path(temp_dir)
 
 
 @pytest.fixture
@@ -60,18 +65,22 @@ def mock_llm():
     return mock
 
 
-@pytest.fixture
-def mock_google_api_key():
-    """Mock Google API key for tests."""
-    with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-google-api-key"}):
-        yield
+@pytest.fixture(scope="session")
+def mock_google_api_key() -> Generator[None, None, None]:
+    """Mock Google API key for tests (set once per session)."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("GOOGLE_API_KEY", "test-google-api-key")
+    yield
+    mp.undo()
 
 
-@pytest.fixture
-def mock_anthropic_api_key():
-    """Mock Anthropic API key for tests."""
-    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-anthropic-api-key"}):
-        yield
+@pytest.fixture(scope="session")
+def mock_anthropic_api_key() -> Generator[None, None, None]:
+    """Mock Anthropic API key for tests (set once per session)."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("ANTHROPIC_API_KEY", "test-anthropic-api-key")
+    yield
+    mp.undo()
 
 
 @pytest.fixture
@@ -5,21 +5,36 @@ import tempfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from src.export.doc_exporter import (
+    _SLUG_TABLE,
+    _get_markdown,
     slugify,
     BaseDocExporter,
     DocPDFExporter,
     DocWordExporter,
     DocHTMLExporter,
     DocMarkdownExporter,
+    bulk_export,
     create_doc_exporter,
 )
 
 
+def _fake_storage(tmp_path, content=None, metadata=None):
+    """Build a lightweight stand-in for UserStorage with a real docs_dir."""
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir(parents=True)
+    return SimpleNamespace(
+        docs_dir=docs_dir,
+        get_doc_content=lambda doc_id, language="en": content,
+        get_doc_metadata=lambda doc_id: metadata,
+    )
+
+
 class TestSlugify:
     """Tests for the slugify utility function."""
 
@@ -57,6 +72,34 @@ class TestSlugify:
         assert slugify("chapter1") == "chapter1"
         assert slugify("Chapter 2 - Advanced") == "chapter-2-advanced"
 
+    def test_slugify_non_ascii_does_not_grow_table(self):
+        """Test that non-ASCII input is slugified without being memoized."""
+        size = len(_SLUG_TABLE)
+        assert slugify("Caf\u00e9\u3000\u0130stanbul \u212aelvin") == "caf-istanbul-kelvin"
+        assert len(_SLUG_TABLE) == size
+
+
+class TestMarkdownRenderer:
+    """Tests for the per-thread Markdown renderer."""
+
+    def test_renderer_reused_within_thread(self):
+        """Test that the same renderer is returned on repeated calls."""
+        assert _get_markdown() is _get_markdown()
+
+    def test_renderer_per_thread(self):
+        """Test that another thread gets its own renderer."""
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(_get_markdown).result()
+        assert other is not _get_markdown()
+
+    def test_renderer_reset_between_documents(self):
+        """Test that state from one document does not leak into the next."""
+        _get_markdown().convert("# First")
+        md = _get_markdown()
+        md.convert("# Second")
+        assert "first" not in md.toc
+
 
 class TestBaseDocExporter:
     """Tests for BaseDocExporter abstract class."""
@@ -70,6 +113,15 @@ class TestBaseDocExporter:
         """Test that file_extension has empty default."""
         assert BaseDocExporter.file_extension == ""
 
+    @pytest.mark.parametrize(
+        "exporter_class",
+        [DocPDFExporter, DocWordExporter, DocHTMLExporter, DocMarkdownExporter],
+    )
+    def test_exporters_have_no_instance_dict(self, exporter_class):
+        """Test that exporters keep their state in slots only."""
+        exporter = exporter_class.__new__(exporter_class)
+        assert not hasattr(exporter, "__dict__")
+
 
 class TestDocPDFExporter:
     """Tests for DocPDFExporter class."""
@@ -92,12 +144,7 @@ class TestDocPDFExporter:
     def pdf_exporter(self, tmp_path):
         """Create a DocPDFExporter for testing."""
         exporter = DocPDFExporter.__new__(DocPDFExporter)
-        storage = MagicMock()
-        storage.docs_dir = tmp_path / "docs"
-        storage.docs_dir.mkdir(parents=True)
-        storage.get_doc_content = MagicMock(return_value="# Test Manual\n\nContent here.")
-        storage.get_doc_metadata = MagicMock(return_value={"title": "Test Manual"})
-        exporter.user_storage = storage
+        exporter.user_storage = _fake_storage(tmp_path, "# Test Manual\n\nContent here.", {"title": "Test Manual"})
         exporter.user_id = "test-user"
         exporter.doc_id = "test-doc"
         return exporter
@@ -117,6 +164,48 @@ class TestDocPDFExporter:
 
         assert path == provided
 
+    def test_export_strips_bundle_stylesheets(self, pdf_exporter, tmp_path):
+        """Test that app bundle <link> tags never reach WeasyPrint."""
+        content = (
+            '# Test\n\n'
+            '<link rel="stylesheet" href="/static/app.bundle.css">\n\n'
+            '<link rel="stylesheet" href="print.css">\n'
+        )
+
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value=content), \
+             patch("src.export.doc_exporter.HTML") as mock_html:
+            pdf_exporter.export(output_path=str(tmp_path / "out.pdf"))
+
+        html = mock_html.call_args.kwargs["string"]
+        assert "app.bundle.css" not in html
+        assert 'href="print.css"' in html
+
+    def test_export_reuses_parsed_stylesheet(self, pdf_exporter, tmp_path):
+        """Test that DEFAULT_CSS is parsed once across PDF exports."""
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value="# Test"), \
+             patch("src.export.doc_exporter.HTML") as mock_html:
+            pdf_exporter.export(output_path=str(tmp_path / "first.pdf"))
+            pdf_exporter.export(output_path=str(tmp_path / "second.pdf"))
+
+        first, second = (
+            call.kwargs["stylesheets"] for call in mock_html.return_value.render.call_args_list
+        )
+        assert first[0] is second[0]
+
+    def test_export_many_renders_once(self, pdf_exporter, tmp_path):
+        """Test that several PDFs are written from one layout pass."""
+        paths = [str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")]
+
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value="# Test"), \
+             patch("src.export.doc_exporter.HTML") as mock_html:
+            document = mock_html.return_value.render.return_value
+            document.write_pdf.side_effect = lambda target: target.write(b"%PDF-1.7")
+            result = pdf_exporter.export_many(paths)
+
+        assert result == paths
+        mock_html.return_value.render.assert_called_once()
+        assert all(Path(path).read_bytes() == b"%PDF-1.7" for path in paths)
+
 
 class TestDocWordExporter:
     """Tests for DocWordExporter class."""
@@ -129,12 +218,7 @@ class TestDocWordExporter:
     def word_exporter(self, tmp_path):
         """Create a DocWordExporter for testing."""
         exporter = DocWordExporter.__new__(DocWordExporter)
-        storage = MagicMock()
-        storage.docs_dir = tmp_path / "docs"
-        storage.docs_dir.mkdir(parents=True)
-        storage.get_doc_content = MagicMock(return_value="# Test Manual\n\nContent here.")
-        storage.get_doc_metadata = MagicMock(return_value={"title": "Test Manual"})
-        exporter.user_storage = storage
+        exporter.user_storage = _fake_storage(tmp_path, "# Test Manual\n\nContent here.", {"title": "Test Manual"})
         exporter.user_id = "test-user"
         exporter.doc_id = "test-doc"
         return exporter
@@ -172,6 +256,23 @@ class TestDocWordExporter:
         # Check that list items were added
         assert len(doc.paragraphs) >= 4
 
+    def test_add_markdown_to_doc_line_kinds(self, word_exporter):
+        """Test that each line kind gets its own style and text."""
+        from docx import Document
+        doc = Document()
+
+        content = "##### Not a heading\n  - Indented item  \n3. Third\n```\ncode line\n```\nPlain"
+        word_exporter._add_markdown_to_doc(doc, content)
+
+        paragraphs = [(p.style.name, p.text) for p in doc.paragraphs]
+        assert paragraphs == [
+            ("Normal", "##### Not a heading"),
+            ("List Bullet", "Indented item"),
+            ("List Number", "Third"),
+            ("Normal", "code line"),
+            ("Normal", "Plain"),
+        ]
+
 
 class TestDocHTMLExporter:
     """Tests for DocHTMLExporter class."""
@@ -193,12 +294,7 @@ class TestDocHTMLExporter:
     def html_exporter(self, tmp_path):
         """Create a DocHTMLExporter for testing."""
         exporter = DocHTMLExporter.__new__(DocHTMLExporter)
-        storage = MagicMock()
-        storage.docs_dir = tmp_path / "docs"
-        storage.docs_dir.mkdir(parents=True)
-        storage.get_doc_content = MagicMock(return_value="# Test Manual\n\nContent here.")
-        storage.get_doc_metadata = MagicMock(return_value={"title": "Test Manual"})
-        exporter.user_storage = storage
+        exporter.user_storage = _fake_storage(tmp_path, "# Test Manual\n\nContent here.", {"title": "Test Manual"})
         exporter.user_id = "test-user"
         exporter.doc_id = "test-doc"
         return exporter
@@ -221,23 +317,47 @@ class TestDocHTMLExporter:
         """Test that images are embedded by default."""
         output_path = str(tmp_path / "embed.html")
 
-        with patch("src.export.doc_exporter.strip_semantic_tags", return_value="# Test"):
-            html_exporter._embed_images_as_base64 = MagicMock(return_value="# Test")
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value="# Test"), \
+             patch.object(DocHTMLExporter, "_embed_images_as_base64", return_value="# Test") as mock_embed:
             result = html_exporter.export(output_path=output_path, embed_images=True)
 
-        html_exporter._embed_images_as_base64.assert_called()
+        mock_embed.assert_called()
 
     def test_export_no_embed_images(self, html_exporter, tmp_path):
         """Test that image embedding can be disabled."""
         output_path = str(tmp_path / "no_embed.html")
 
-        with patch("src.export.doc_exporter.strip_semantic_tags", return_value="# Test"):
-            html_exporter._embed_images_as_base64 = MagicMock()
-            html_exporter._fix_image_paths = MagicMock(return_value="# Test")
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value="# Test"), \
+             patch.object(DocHTMLExporter, "_embed_images_as_base64") as mock_embed, \
+             patch.object(DocHTMLExporter, "_fix_image_paths", return_value="# Test") as mock_fix:
             result = html_exporter.export(output_path=output_path, embed_images=False)
 
-        html_exporter._embed_images_as_base64.assert_not_called()
-        html_exporter._fix_image_paths.assert_called()
+        mock_embed.assert_not_called()
+        mock_fix.assert_called()
+
+    def test_export_reuses_stripped_content(self, html_exporter, tmp_path):
+        """Test that re-exporting the same document reuses the stripped markdown."""
+        from src.export import tag_parser
+
+        html_exporter.export(output_path=str(tmp_path / "first.html"))
+        with patch.object(tag_parser, "_strip_tags", wraps=tag_parser._strip_tags) as mock_strip:
+            html_exporter.export(output_path=str(tmp_path / "second.html"))
+
+        mock_strip.assert_not_called()
+
+    def test_stripped_content_cache_bounded_by_bytes(self, monkeypatch):
+        """Test that the strip cache evicts old documents past its byte budget."""
+        from src.export import tag_parser
+
+        monkeypatch.setattr(tag_parser, "_strip_cache", tag_parser.OrderedDict())
+        monkeypatch.setattr(tag_parser, "_strip_cache_bytes", 0)
+        monkeypatch.setattr(tag_parser, "_STRIP_CACHE_MAX_BYTES", 50)
+
+        for i in range(5):
+            tag_parser.strip_semantic_tags(f"<step>Document number {i}</step>")
+
+        assert 0 < tag_parser._strip_cache_bytes <= 50
+        assert len(tag_parser._strip_cache) < 5
 
 
 class TestDocMarkdownExporter:
@@ -251,11 +371,7 @@ class TestDocMarkdownExporter:
     def md_exporter(self, tmp_path):
         """Create a DocMarkdownExporter for testing."""
         exporter = DocMarkdownExporter.__new__(DocMarkdownExporter)
-        storage = MagicMock()
-        storage.docs_dir = tmp_path / "docs"
-        storage.docs_dir.mkdir(parents=True)
-        storage.get_doc_content = MagicMock(return_value="# Test\n\n![Image](screenshots/test.png)")
-        exporter.user_storage = storage
+        exporter.user_storage = _fake_storage(tmp_path, "# Test\n\n![Image](screenshots/test.png)")
         exporter.user_id = "test-user"
         exporter.doc_id = "test-doc"
         return exporter
@@ -308,6 +424,95 @@ class TestDocMarkdownExporter:
             names = zf.namelist()
             assert any("images/test.png" in name for name in names)
 
+    def test_zip_skips_missing_images(self, md_exporter, tmp_path):
+        """Test that references to missing screenshots are left untouched."""
+        output_path = str(tmp_path / "output.zip")
+
+        screenshots_dir = md_exporter.user_storage.docs_dir / "test-doc" / "screenshots"
+        screenshots_dir.mkdir(parents=True)
+        (screenshots_dir / "present.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        content = "![A](screenshots/present.png)\n\n![B](screenshots/missing.png)"
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value=content):
+            result = md_exporter.export(output_path=output_path)
+
+        with zipfile.ZipFile(result, "r") as zf:
+            assert sorted(zf.namelist()) == ["images/present.png", "test-doc.md"]
+            markdown_text = zf.read("test-doc.md").decode()
+        assert "![A](./images/present.png)" in markdown_text
+        assert "![B](screenshots/missing.png)" in markdown_text
+
+    def test_zip_contains_nested_images(self, md_exporter, tmp_path):
+        """Test that screenshots in subdirectories are zipped, but not paths escaping the directory."""
+        output_path = str(tmp_path / "output.zip")
+
+        doc_dir = md_exporter.user_storage.docs_dir / "test-doc"
+        (doc_dir / "screenshots" / "sub").mkdir(parents=True)
+        (doc_dir / "screenshots" / "sub" / "x.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+        (doc_dir / "outside.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        content = (
+            "![A](screenshots/sub/x.png)\n\n![B](../screenshots/sub/x.png)\n\n"
+            "![C](screenshots/sub/../../outside.png)"
+        )
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value=content):
+            result = md_exporter.export(output_path=output_path)
+
+        with zipfile.ZipFile(result, "r") as zf:
+            assert sorted(zf.namelist()) == ["images/sub/x.png", "test-doc.md"]
+            markdown_text = zf.read("test-doc.md").decode()
+        assert "![A](./images/sub/x.png)" in markdown_text
+        assert "![B](./images/sub/x.png)" in markdown_text
+        assert "![C](screenshots/sub/../../outside.png)" in markdown_text
+
+    def test_zip_skips_images_when_screenshots_is_not_a_directory(self, md_exporter, tmp_path):
+        """Test that an unreadable screenshots path skips images instead of failing."""
+        output_path = str(tmp_path / "output.zip")
+
+        doc_dir = md_exporter.user_storage.docs_dir / "test-doc"
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "screenshots").write_text("not a directory")
+
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value="![A](screenshots/a.png)"):
+            result = md_exporter.export(output_path=output_path)
+
+        with zipfile.ZipFile(result, "r") as zf:
+            assert zf.namelist() == ["test-doc.md"]
+
+    def test_zip_stores_images_uncompressed(self, md_exporter, tmp_path):
+        """Test that PNGs are stored as-is while markdown is deflated."""
+        output_path = str(tmp_path / "output.zip")
+
+        screenshots_dir = md_exporter.user_storage.docs_dir / "test-doc" / "screenshots"
+        screenshots_dir.mkdir(parents=True)
+        from PIL import Image
+        img = Image.new("RGB", (10, 10), "red")
+        img.save(screenshots_dir / "test.png")
+
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value="# Test\n\n![Image](screenshots/test.png)"):
+            result = md_exporter.export(output_path=output_path)
+
+        with zipfile.ZipFile(result, "r") as zf:
+            assert zf.getinfo("images/test.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("test-doc.md").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_zip_compression_follows_file_contents(self, md_exporter, tmp_path):
+        """Test that compression is chosen from magic bytes, not the extension."""
+        output_path = str(tmp_path / "output.zip")
+
+        screenshots_dir = md_exporter.user_storage.docs_dir / "test-doc" / "screenshots"
+        screenshots_dir.mkdir(parents=True)
+        (screenshots_dir / "photo.img").write_bytes(b"\xff\xd8\xff\xe0" + bytes(64))
+        (screenshots_dir / "vector.png").write_text("<svg xmlns='http://www.w3.org/2000/svg'/>")
+
+        content = "![A](screenshots/photo.img)\n\n![B](screenshots/vector.png)"
+        with patch("src.export.doc_exporter.strip_semantic_tags", return_value=content):
+            result = md_exporter.export(output_path=output_path)
+
+        with zipfile.ZipFile(result, "r") as zf:
+            assert zf.getinfo("images/photo.img").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("images/vector.png").compress_type == zipfile.ZIP_DEFLATED
+
 
 class TestCreateDocExporter:
     """Tests for create_doc_exporter factory function."""
@@ -390,6 +595,49 @@ class TestCreateDocExporter:
             assert "Unsupported export format" in str(exc_info.value)
 
 
+class TestBulkExport:
+    """Tests for bulk_export concurrent multi-format export."""
+
+    @pytest.fixture
+    def mock_storage(self, tmp_path):
+        """Patch UserStorage with a single stored manual."""
+        with patch("src.export.doc_exporter.UserStorage") as mock_storage:
+            storage = mock_storage.return_value
+            storage.docs_dir = tmp_path
+            storage.get_doc_content.return_value = "# Test Manual\n\nContent here."
+            storage.get_doc_metadata.return_value = {"title": "Test Manual"}
+            (tmp_path / "test-doc").mkdir()
+            yield storage
+
+    def test_bulk_export_creates_all_files(self, mock_storage):
+        """Test that every requested format is exported."""
+        with patch("src.export.doc_exporter.HTML") as mock_html:
+            mock_html.return_value.render.return_value.write_pdf.side_effect = (
+                lambda target, **kwargs: target.write(b"%PDF-1.7")
+            )
+            results = bulk_export("user-id", "test-doc", ["pdf", "html", "md"])
+
+        assert set(results) == {"pdf", "html", "md"}
+        assert results["pdf"].endswith(".pdf")
+        assert results["html"].endswith(".html")
+        assert results["md"].endswith(".zip")
+        assert all(Path(path).exists() for path in results.values())
+
+    def test_bulk_export_shares_aliases(self, mock_storage):
+        """Test that format aliases are exported once."""
+        results = bulk_export("user-id", "test-doc", ["word", "docx"])
+
+        assert results["word"] == results["docx"]
+        assert len(list((mock_storage.docs_dir / "test-doc" / "exports").iterdir())) == 1
+
+    def test_bulk_export_invalid_format(self, mock_storage):
+        """Test that an unsupported format fails before anything is exported."""
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            bulk_export("user-id", "test-doc", ["html", "invalid"])
+
+        assert not (mock_storage.docs_dir / "test-doc" / "exports").exists()
+
+
 class TestExportSingleDoc:
     """Tests for exporting single documents."""
 
@@ -397,12 +645,7 @@ class TestExportSingleDoc:
     def html_exporter(self, tmp_path):
         """Create DocHTMLExporter for single doc testing."""
         exporter = DocHTMLExporter.__new__(DocHTMLExporter)
-        storage = MagicMock()
-        storage.docs_dir = tmp_path / "docs"
-        storage.docs_dir.mkdir(parents=True)
-        storage.get_doc_content = MagicMock(return_value="# Test Manual\n\nContent.")
-        storage.get_doc_metadata = MagicMock(return_value={"title": "Test"})
-        exporter.user_storage = storage
+        exporter.user_storage = _fake_storage(tmp_path, "# Test Manual\n\nContent.", {"title": "Test"})
         exporter.user_id = "test-user"
         exporter.doc_id = "test-doc"
         return exporter
@@ -437,12 +680,7 @@ class TestExportWithOptions:
     def html_exporter(self, tmp_path):
         """Create DocHTMLExporter for options testing."""
         exporter = DocHTMLExporter.__new__(DocHTMLExporter)
-        storage = MagicMock()
-        storage.docs_dir = tmp_path / "docs"
-        storage.docs_dir.mkdir(parents=True)
-        storage.get_doc_content = MagicMock(return_value="# Test\n\n![Image](screenshots/test.png)")
-        storage.get_doc_metadata = MagicMock(return_value={"title": "Test"})
-        exporter.user_storage = storage
+        exporter.user_storage = _fake_storage(tmp_path, "# Test\n\n![Image](screenshots/test.png)", {"title": "Test"})
         exporter.user_id = "test-user"
         exporter.doc_id = "test-doc"
         return exporter
@@ -484,10 +722,7 @@ class TestImagePathFixing:
     def exporter(self, tmp_path):
         """Create exporter for image path tests."""
         exporter = DocHTMLExporter.__new__(DocHTMLExporter)
-        storage = MagicMock()
-        storage.docs_dir = tmp_path / "docs"
-        storage.docs_dir.mkdir(parents=True)
-        exporter.user_storage = storage
+        exporter.user_storage = _fake_storage(tmp_path)
         exporter.doc_id = "test-doc"
         return exporter
 
@@ -514,6 +749,17 @@ class TestImagePathFixing:
 
         assert "file://" in result
 
+    def test_fix_image_paths_brackets_in_alt_text(self, exporter):
+        """Test that alt text containing brackets is still rewritten."""
+        screenshots_dir = exporter.user_storage.docs_dir / "test-doc" / "screenshots"
+        screenshots_dir.mkdir(parents=True)
+        (screenshots_dir / "a.png").touch()
+
+        content = "![Click [Save] button](screenshots/a.png)"
+        result = exporter._fix_image_paths(content)
+
+        assert result == f"![Click [Save] button](file://{screenshots_dir / 'a.png'})"
+
     def test_fix_image_paths_preserves_missing(self, exporter):
         """Test that missing images paths are preserved."""
         content = "![Alt](nonexistent.png)"
@@ -529,10 +775,7 @@ class TestEmbedImagesAsBase64:
     def html_exporter(self, tmp_path):
         """Create DocHTMLExporter for base64 tests."""
         exporter = DocHTMLExporter.__new__(DocHTMLExporter)
-        storage = MagicMock()
-        storage.docs_dir = tmp_path / "docs"
-        storage.docs_dir.mkdir(parents=True)
-        exporter.user_storage = storage
+        exporter.user_storage = _fake_storage(tmp_path)
         exporter.doc_id = "test-doc"
         return exporter
 
@@ -596,3 +839,29 @@ class TestEmbedImagesAsBase64:
         result = html_exporter._embed_images_as_base64(content)
 
         assert "screenshots/nonexistent.png" in result
+
+    def test_embed_reuses_cached_encoding(self, html_exporter):
+        """Test that re-embedding an unchanged image hits the cache."""
+        screenshots_dir = html_exporter.user_storage.docs_dir / "test-doc" / "screenshots"
+        screenshots_dir.mkdir(parents=True)
+        (screenshots_dir / "cached.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        content = "![Alt](screenshots/cached.png)"
+        with patch("src.export.image_data._encode_file", return_value="iVBORw0KGgo=") as mock_encode:
+            first = html_exporter._embed_images_as_base64(content)
+            second = html_exporter._embed_images_as_base64(content)
+
+        assert second == first
+        mock_encode.assert_called_once()
+
+    def test_embed_large_image_round_trips(self, html_exporter):
+        """Test that a large image round-trips intact through base64 embedding."""
+        screenshots_dir = html_exporter.user_storage.docs_dir / "test-doc" / "screenshots"
+        screenshots_dir.mkdir(parents=True)
+        data = bytes(range(256)) * 1000
+        (screenshots_dir / "large.png").write_bytes(data)
+
+        result = html_exporter._embed_images_as_base64("![Alt](large.png)")
+
+        encoded = result.split("base64,", 1)[1].rstrip(")")
+        assert base64.b64decode(encoded) == data
@@ -1,28 +1,51 @@
 """Tests for src/export/html_exporter.py - HTML export functionality."""
 
 import base64
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.export.html_exporter import HTMLExporter, DEFAULT_HTML_CSS
+from src.export import html_exporter as html_exporter_module, image_data
+from src.export.html_exporter import (
+    HTMLExporter,
+    DEFAULT_HTML_CSS,
+    _get_markdown,
+)
+
+# Tiny valid 10x10 images, generated once with Pillow, so the embedding
+# tests do not need to import and run an image encoder
+_TINY_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d494844520000000a0000000a0802000000025058ea000000"
+    "1249444154789c63fccf800f30e1951db1d200412c0113b10a73130000000049454e44ae"
+    "426082"
+)
+_TINY_JPEG = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb0043000806060706050807070709"
+    "09080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720222c231c1c283729"
+    "2c30313434341f27393d38323c2e333432ffc0000b08000a000a01011100ffc400150001"
+    "0100000000000000000000000000000008ffc40014100100000000000000000000000000"
+    "000000ffda0008010100003f009fc07fffd9"
+)
+_TINY_GIF = bytes.fromhex(
+    "4749463837610a000a00810000ffff000000000000000000002c000000000a000a000008"
+    "120001081c48b0a0c18308132a5cc8b061c280003b"
+)
 
 
 @pytest.fixture
-def mock_user_storage():
+def mock_user_storage(tmp_path_factory):
     """Create a mock UserStorage instance."""
     storage = MagicMock()
-    storage.docs_dir = Path(tempfile.mkdtemp())
+    storage.docs_dir = tmp_path_factory.mktemp("docs")
     return storage
 
 
 @pytest.fixture
-def mock_project_storage():
+def mock_project_storage(tmp_path_factory):
     """Create a mock ProjectStorage instance."""
     storage = MagicMock()
-    storage.projects_dir = Path(tempfile.mkdtemp())
+    storage.projects_dir = tmp_path_factory.mktemp("projects")
     return storage
 
 
@@ -178,10 +201,7 @@ class TestImageBase64Embedding:
         img_dir.mkdir()
         img_path = img_dir / "test.png"
 
-        # Create a simple PNG file
-        from PIL import Image
-        img = Image.new("RGB", (10, 10), color="red")
-        img.save(img_path)
+        img_path.write_bytes(_TINY_PNG)
 
         html_content = f'<img src="{img_path}" alt="test">'
         result = html_exporter._embed_images(html_content)
@@ -195,9 +215,7 @@ class TestImageBase64Embedding:
         img_dir.mkdir()
         img_path = img_dir / "test.png"
 
-        from PIL import Image
-        img = Image.new("RGB", (10, 10), color="blue")
-        img.save(img_path)
+        img_path.write_bytes(_TINY_PNG)
 
         html_content = f'<img src="file://{img_path}" alt="test">'
         result = html_exporter._embed_images(html_content)
@@ -212,15 +230,23 @@ class TestImageBase64Embedding:
         # Should keep original src
         assert 'src="/nonexistent/image.png"' in result
 
+    def test_embed_images_returns_imageless_html_unchanged(self, html_exporter):
+        """Test that HTML without any src attribute is returned as-is."""
+        html_content = "<h1>No images</h1><p>Just text.</p>"
+
+        with patch("src.export.html_exporter._IMG_SRC_RE") as mock_re:
+            result = html_exporter._embed_images(html_content)
+
+        assert result is html_content
+        mock_re.finditer.assert_not_called()
+
     def test_embed_images_handles_jpg(self, html_exporter, tmp_path):
         """Test that JPG images are embedded with correct MIME type."""
         img_dir = tmp_path / "images"
         img_dir.mkdir()
         img_path = img_dir / "test.jpg"
 
-        from PIL import Image
-        img = Image.new("RGB", (10, 10), color="green")
-        img.save(img_path, "JPEG")
+        img_path.write_bytes(_TINY_JPEG)
 
         html_content = f'<img src="{img_path}" alt="test">'
         result = html_exporter._embed_images(html_content)
@@ -233,9 +259,7 @@ class TestImageBase64Embedding:
         img_dir.mkdir()
         img_path = img_dir / "test.gif"
 
-        from PIL import Image
-        img = Image.new("RGB", (10, 10), color="yellow")
-        img.save(img_path, "GIF")
+        img_path.write_bytes(_TINY_GIF)
 
         html_content = f'<img src="{img_path}" alt="test">'
         result = html_exporter._embed_images(html_content)
@@ -259,12 +283,10 @@ class TestImageBase64Embedding:
         img_dir.mkdir()
 
         # Create multiple images
-        from PIL import Image
         paths = []
         for i in range(3):
             img_path = img_dir / f"test{i}.png"
-            img = Image.new("RGB", (10, 10), color=(i * 50, i * 50, i * 50))
-            img.save(img_path)
+            img_path.write_bytes(_TINY_PNG)
             paths.append(img_path)
 
         html_content = "\n".join([f'<img src="{p}" alt="test{i}">' for i, p in enumerate(paths)])
@@ -274,6 +296,66 @@ class TestImageBase64Embedding:
         data_uri_count = result.count("data:image/png;base64,")
         assert data_uri_count == 3
 
+    def test_embed_images_splices_in_order(self, html_exporter, tmp_path):
+        """Test that mixed present and missing images are rewritten in place."""
+        img_path = tmp_path / "present.png"
+        img_path.write_bytes(_TINY_PNG)
+
+        html_content = (
+            f'<p>a</p><img src="{img_path}"><p>b</p>'
+            '<img src="/nonexistent/missing.png"><p>c</p>'
+            f'<img src="file://{img_path}">'
+        )
+        result = html_exporter._embed_images(html_content)
+
+        data_uri = "data:image/png;base64," + base64.b64encode(_TINY_PNG).decode()
+        assert result == (
+            f'<p>a</p><img src="{data_uri}"><p>b</p>'
+            '<img src="/nonexistent/missing.png"><p>c</p>'
+            f'<img src="{data_uri}">'
+        )
+
+    def test_embed_images_handles_empty_file(self, html_exporter, tmp_path):
+        """Test that an empty image file embeds as an empty data URI."""
+        img_path = tmp_path / "empty.png"
+        img_path.write_bytes(b"")
+
+        result = html_exporter._embed_images(f'<img src="{img_path}" alt="empty">')
+
+        assert 'src="data:image/png;base64,"' in result
+
+    def test_embed_images_encodes_shared_image_once(self, html_exporter, tmp_path):
+        """Test that a screenshot referenced twice is encoded once."""
+        img_path = tmp_path / "shared.png"
+        img_path.write_bytes(_TINY_PNG)
+        other_path = tmp_path / "other.png"
+        other_path.write_bytes(_TINY_PNG)
+
+        html_content = (
+            f'<img src="{img_path}" alt="a">\n<img src="file://{img_path}" alt="b">'
+            f'\n<img src="{other_path}" alt="c">'
+        )
+        with patch("src.export.image_data._encode_file", wraps=image_data._encode_file) as mock_encode:
+            result = html_exporter._embed_images(html_content)
+
+        assert result.count("data:image/png;base64,") == 3
+        assert sorted(call.args[0] for call in mock_encode.call_args_list) == sorted(
+            [str(img_path), str(other_path)]
+        )
+
+    def test_embed_images_reencodes_modified_image(self, html_exporter, tmp_path):
+        """Test that an edited screenshot is not served from the cache."""
+        img_path = tmp_path / "edited.png"
+        img_path.write_bytes(b"first")
+        html_content = f'<img src="{img_path}" alt="edited">'
+        first = html_exporter._embed_images(html_content)
+
+        img_path.write_bytes(b"second version")
+        second = html_exporter._embed_images(html_content)
+
+        assert base64.b64encode(b"second version").decode() in second
+        assert second != first
+
 
 class TestCSSStyleing:
     """Tests for CSS styling functionality."""
@@ -283,6 +365,12 @@ class TestCSSStyleing:
         assert DEFAULT_HTML_CSS is not None
         assert len(DEFAULT_HTML_CSS) > 0
 
+    def test_default_css_is_minified(self):
+        """Test that the embedded default CSS has no comments or line breaks."""
+        assert "/*" not in DEFAULT_HTML_CSS
+        assert "\n" not in DEFAULT_HTML_CSS
+        assert ";}" not in DEFAULT_HTML_CSS and "; }" not in DEFAULT_HTML_CSS
+
     def test_default_css_has_body_styles(self):
         """Test that default CSS includes body styles."""
         assert "body {" in DEFAULT_HTML_CSS
@@ -452,6 +540,60 @@ class TestMarkdownConversion:
         assert "<img " in html
         assert "alt=" in html
 
+    def test_convert_reuses_cached_html(self, html_exporter):
+        """Test that unchanged markdown is converted only once."""
+        md = "# Cached conversion\n\nSame source twice."
+        first = html_exporter._convert_markdown_to_html(md)
+
+        with patch.object(HTMLExporter, "_render_markdown") as mock_render:
+            second = html_exporter._convert_markdown_to_html(md)
+
+        mock_render.assert_not_called()
+        assert second == first
+
+    def test_renderer_reused_and_reset(self, html_exporter):
+        """Test that the per-thread renderer is reused without leaking state."""
+        assert _get_markdown() is _get_markdown()
+
+        first = html_exporter._render_markdown("# Same heading")
+        second = html_exporter._render_markdown("# Same heading")
+
+        assert 'id="same-heading"' in first
+        assert second == first
+
+    def test_convert_cache_distinguishes_sources(self, html_exporter):
+        """Test that different markdown is not served from the cache."""
+        first = html_exporter._convert_markdown_to_html("# First source")
+        second = html_exporter._convert_markdown_to_html("# Second source")
+
+        assert "First source" in first
+        assert "Second source" in second
+
+    def test_convert_cache_bounded_by_bytes(self, html_exporter, monkeypatch):
+        """Test that cached documents are evicted once past the byte budget."""
+        monkeypatch.setattr(html_exporter_module, "_html_cache", html_exporter_module.OrderedDict())
+        monkeypatch.setattr(html_exporter_module, "_html_cache_bytes", 0)
+        monkeypatch.setattr(html_exporter_module, "_HTML_CACHE_MAX_BYTES", 100)
+
+        for i in range(5):
+            html_exporter._convert_markdown_to_html(f"# Source {i}")
+
+        assert 0 < html_exporter_module._html_cache_bytes <= 100
+        assert html_exporter_module._html_cache_bytes == sum(
+            len(html) for html in html_exporter_module._html_cache.values()
+        )
+        assert len(html_exporter_module._html_cache) < 5
+
+    def test_convert_skips_cache_for_oversized_document(self, html_exporter, monkeypatch):
+        """Test that a document larger than the whole budget is not cached."""
+        monkeypatch.setattr(html_exporter_module, "_html_cache", html_exporter_module.OrderedDict())
+        monkeypatch.setattr(html_exporter_module, "_html_cache_bytes", 0)
+        monkeypatch.setattr(html_exporter_module, "_HTML_CACHE_MAX_BYTES", 10)
+
+        html_exporter._convert_markdown_to_html("# A heading longer than the budget")
+
+        assert not html_exporter_module._html_cache
+
 
 class TestHTMLDocumentStructure:
     """Tests for complete HTML document structure."""
@@ -575,3 +717,46 @@ class TestExportOptions:
             content = f.read()
 
         assert "\u4e2d\u6587" in content  # Chinese characters
+
+
+class TestCombinedMarkdown:
+    """Tests for combined markdown assembly."""
+
+    @pytest.fixture
+    def html_exporter(self, tmp_path):
+        """Create HTMLExporter with a multi-chapter project."""
+        exporter = HTMLExporter.__new__(HTMLExporter)
+        exporter.user_storage = MagicMock()
+        exporter.user_storage.docs_dir = tmp_path
+        exporter.project_storage = MagicMock()
+        exporter.project = {
+            "name": "Test Project",
+            "chapters": [
+                {"id": "chapter-2", "title": "Second", "order": 2, "manuals": ["manual-c"]},
+                {"id": "chapter-1", "title": "First", "order": 1, "manuals": ["manual-a", "manual-b"]},
+            ],
+        }
+        return exporter
+
+    def test_manuals_keep_project_order(self, html_exporter):
+        """Test that concurrently loaded manuals are joined in chapter order."""
+        contents = {"manual-a": "Alpha body", "manual-b": "Beta body", "manual-c": "Gamma body"}
+        html_exporter._get_doc_content = lambda doc_id, language: contents[doc_id]
+
+        result = html_exporter._build_combined_markdown("en", include_chapter_covers=True)
+
+        positions = [
+            result.index(marker)
+            for marker in ("Chapter 1: First", "Alpha body", "Beta body", "Chapter 2: Second", "Gamma body")
+        ]
+        assert positions == sorted(positions)
+
+    def test_missing_manual_notice(self, html_exporter):
+        """Test that manuals without content get a not-found notice."""
+        html_exporter._get_doc_content = lambda doc_id, language: None if doc_id == "manual-b" else doc_id
+
+        result = html_exporter._build_combined_markdown("de")
+
+        assert "## manual-b\n" in result
+        assert "*Manual not found for language: de*" in result
+        assert result.count('<div class="manual-section" markdown="1">') == 2
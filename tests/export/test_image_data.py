@@ -0,0 +1,92 @@
+"""Tests for src/export/image_data.py - Shared image data URI encoding."""
+
+import base64
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.export import image_data
+from src.export.image_data import image_data_uri
+
+
+def _data_uri(path):
+    """Encode a file through the cache using its current stat identity."""
+    st = os.stat(path)
+    return image_data_uri(str(path), st.st_mtime_ns, st.st_size)
+
+
+class TestImageDataUri:
+    """Tests for image_data_uri."""
+
+    def test_encodes_file_with_mime_type(self, tmp_path):
+        """Test that the data URI carries the MIME type and base64 payload."""
+        path = tmp_path / "shot.jpg"
+        path.write_bytes(b"\xff\xd8\xff\xe0jpeg")
+
+        assert _data_uri(path) == "data:image/jpeg;base64," + base64.b64encode(b"\xff\xd8\xff\xe0jpeg").decode()
+
+    @pytest.mark.parametrize("filename,mime_type", [
+        ("a.PNG", "image/png"),
+        ("a.webp", "image/webp"),
+        ("a.svg", "image/svg+xml"),
+        ("a", "image/png"),
+    ])
+    def test_mime_type_by_extension(self, tmp_path, filename, mime_type):
+        """Test MIME type lookup, defaulting to PNG."""
+        path = tmp_path / filename
+        path.write_bytes(b"x")
+
+        assert _data_uri(path).startswith(f"data:{mime_type};base64,")
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file encodes as an empty payload."""
+        path = tmp_path / "empty.png"
+        path.touch()
+
+        assert _data_uri(path) == "data:image/png;base64,"
+
+    def test_same_mtime_rewrite_is_reencoded(self, tmp_path):
+        """Test that a rewrite keeping the mtime but changing size is not a stale hit."""
+        path = tmp_path / "shot.png"
+        path.write_bytes(b"first")
+        st = os.stat(path)
+        first = _data_uri(path)
+
+        path.write_bytes(b"second version")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert _data_uri(path) != first
+        assert _data_uri(path).endswith(base64.b64encode(b"second version").decode())
+
+    def test_cache_bounded_by_bytes(self, tmp_path, monkeypatch):
+        """Test that least recently used entries are evicted past the byte budget."""
+        monkeypatch.setattr(image_data, "_cache", image_data.OrderedDict())
+        monkeypatch.setattr(image_data, "_cache_bytes", 0)
+        monkeypatch.setattr(image_data, "_CACHE_MAX_BYTES", 130)
+
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"shot{i}.png"
+            path.write_bytes(bytes(30))
+            paths.append(path)
+            _data_uri(path)
+
+        assert image_data._cache_bytes <= 130
+        assert [key[0] for key in image_data._cache] == [str(p) for p in paths[-2:]]
+
+    def test_oversized_image_not_cached(self, tmp_path, monkeypatch):
+        """Test that an image larger than the whole budget bypasses the cache."""
+        monkeypatch.setattr(image_data, "_cache", image_data.OrderedDict())
+        monkeypatch.setattr(image_data, "_cache_bytes", 0)
+        monkeypatch.setattr(image_data, "_CACHE_MAX_BYTES", 10)
+
+        path = tmp_path / "big.png"
+        path.write_bytes(bytes(64))
+
+        with patch.object(image_data, "_encode_file", wraps=image_data._encode_file) as mock_encode:
+            _data_uri(path)
+            _data_uri(path)
+
+        assert mock_encode.call_count == 2
+        assert not image_data._cache
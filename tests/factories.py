@@ -181,3 +181,35 @@ def create_docx_bytes() -> bytes:
 </w:document>''')
 
     return buffer.getvalue()
+
+
+MULTIPART_BOUNDARY = "vdocs-test-boundary"
+MULTIPART_HEADERS = {"Content-Type": f"multipart/form-data; boundary={MULTIPART_BOUNDARY}"}
+
+
+def create_multipart_body(
+    filename: str,
+    content: bytes,
+    content_type: str,
+    fields: Optional[dict[str, str]] = None,
+) -> bytes:
+    """Create a pre-encoded multipart/form-data upload body.
+
+    Send it with ``content=`` and ``MULTIPART_HEADERS`` so httpx skips
+    multipart encoding on every request.
+    """
+    boundary = f"--{MULTIPART_BOUNDARY}".encode()
+    parts = []
+    for name, value in (fields or {}).items():
+        parts.append(
+            boundary + b"\r\n"
+            + f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+            + value.encode() + b"\r\n"
+        )
+    parts.append(
+        boundary + b"\r\n"
+        + f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'.encode()
+        + f"Content-Type: {content_type}\r\n\r\n".encode()
+        + content + b"\r\n"
+    )
+    return b"".join(parts) + boundary + b"--\r\n"
@@ -25,6 +25,15 @@ class TestUserStorageInit:
         assert test_storage.docs_dir == test_storage.user_dir / "docs"
         assert test_storage.user_dir.name == test_user_id
 
+    def test_ensure_user_folders_only_creates_once(self, test_storage):
+        """Test that repeat ensure_user_folders calls skip the mkdir syscalls."""
+        test_storage.ensure_user_folders()
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            test_storage.ensure_user_folders()
+
+        mock_mkdir.assert_not_called()
+
 
 class TestListDocs:
     """Tests for listing documents."""